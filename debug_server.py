@@ -1,64 +1,134 @@
 #!/usr/bin/env python3
 
 import sys
-import os
 import time
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import logging
+from pathlib import Path
 
-from flask import Flask, request, jsonify
-import base64
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE))
+
+from flask import Flask, Response, request
+import binascii
+import json
 from src.cli.main import convert
 
+# orjson is optional; it quotes and escapes text much faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    def _dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _dumps = json.dumps
+
 app = Flask(__name__)
 
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+# Target formats whose bytes result is returned as an image data URL
+_IMAGE_FORMATS = frozenset(('jpeg', 'png', 'gif', 'bmp', 'webp', 'tiff', 'ico'))
+
+# Image results above this size are streamed instead of built in memory
+_STREAM_THRESHOLD = 1024 * 1024
+
+# Input bytes per streamed base64 chunk; a multiple of 3 so no chunk is padded
+_B64_CHUNK = 57 * 1024
+
+
+def _stream_image_response(result, mime_type, conversion_time):
+    """
+    Stream an image result as a JSON object with a base64 data URL.
+    
+    The base64 text is encoded chunk by chunk from a memoryview of the
+    result, so the full encoded payload is never held in memory at once.
+    Base64 characters need no JSON escaping, which lets the data URL be
+    written straight into the output.
+    """
+    head = _dumps({
+        'success': True,
+        'result_type': 'image',
+        'size': len(result),
+        'conversion_time': conversion_time
+    })
+    
+    def generate():
+        view = memoryview(result)
+        yield f'{head[:-1]},"data_url":"data:{mime_type};base64,'.encode('ascii')
+        for start in range(0, len(view), _B64_CHUNK):
+            yield binascii.b2a_base64(view[start:start + _B64_CHUNK], newline=False)
+        yield b'"}'
+    
+    return Response(generate(), mimetype='application/json')
+
+
 @app.route('/test_convert', methods=['POST'])
-def test_convert():
+def test_convert(_convert=convert, _b2a=binascii.b2a_base64, _dumps=_dumps, _perf=time.perf_counter):
     """Simplified test endpoint"""
-    start_time = time.time()
+    # Hot names are bound as defaults so each request uses fast local lookups
+    start_time = _perf()
     
     try:
-        data = request.get_json() or request.form
-        from_format = data.get('from_format')
-        to_format = data.get('to_format')
-        input_data = data.get('input_data')
+        # Pick the parser from the content type so only one of them runs
+        if request.is_json:
+            data = request.get_json(cache=False, silent=True) or {}
+        else:
+            data = request.form
+        get = data.get
+        from_format = get('from_format')
+        to_format = get('to_format')
+        input_data = get('input_data')
         
-        print(f"Converting {from_format} -> {to_format}, input length: {len(input_data) if input_data else 0}")
+        n = len(input_data) if input_data else 0
+        log.info("Converting %s -> %s, input length: %d", from_format, to_format, n)
         
         # Perform conversion
-        result = convert(input_data, from_format, to_format)
+        result = _convert(input_data, from_format, to_format)
         
-        conversion_time = time.time() - start_time
-        print(f"Conversion completed in {conversion_time:.3f}s, result size: {len(result) if isinstance(result, bytes) else len(str(result))}")
+        conversion_time = _perf() - start_time
+        # Size without rendering the result to a string (-1 for unsized results)
+        is_bytes = isinstance(result, bytes)
+        size = len(result) if hasattr(result, '__len__') else -1
+        log.info("Conversion completed in %.3fs, result size: %d", conversion_time, size)
         
         # Simple response for images
-        if to_format.lower() in ['jpeg', 'png', 'gif', 'bmp'] and isinstance(result, bytes):
-            result_base64 = base64.b64encode(result).decode('utf-8')
-            mime_type = f'image/{to_format.lower()}'
+        tof_lower = to_format.lower()
+        if is_bytes and tof_lower in _IMAGE_FORMATS:
+            mime_type = 'image/x-icon' if tof_lower == 'ico' else f'image/{tof_lower}'
+            if len(result) > _STREAM_THRESHOLD:
+                return _stream_image_response(result, mime_type, conversion_time)
+            
+            # The response shapes are fixed, so the JSON is written directly;
+            # base64 needs no escaping and _dumps only quotes free text
+            prefix = f'data:{mime_type};base64,'.encode('ascii')
+            data_url = (prefix + _b2a(result, newline=False)).decode('ascii')
             
-            return jsonify({
-                'success': True,
-                'result_type': 'image',
-                'data_url': f'data:{mime_type};base64,{result_base64}',
-                'size': len(result),
-                'conversion_time': conversion_time
-            })
+            return Response(
+                f'{{"success":true,"result_type":"image","data_url":"{data_url}",'
+                f'"size":{size},"conversion_time":{conversion_time!r}}}',
+                mimetype='application/json'
+            )
         else:
-            return jsonify({
-                'success': True,
-                'result': str(result),
-                'result_type': 'text',
-                'conversion_time': conversion_time
-            })
+            return Response(
+                f'{{"success":true,"result":{_dumps(str(result))},"result_type":"text",'
+                f'"conversion_time":{conversion_time!r}}}',
+                mimetype='application/json'
+            )
             
     except Exception as e:
-        error_time = time.time() - start_time
-        print(f"Error after {error_time:.3f}s: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'error_time': error_time
-        })
+        error_time = _perf() - start_time
+        log.info("Error after %.3fs: %s", error_time, e)
+        return Response(
+            f'{{"success":false,"error":{_dumps(str(e))},"error_time":{error_time!r}}}',
+            mimetype='application/json'
+        )
 
 if __name__ == '__main__':
+    logging.basicConfig(format='%(message)s')
     print("Starting test Flask server...")
-    app.run(host='127.0.0.1', port=5001, debug=True)
\ No newline at end of file
+    app.run(host='127.0.0.1', port=5001, debug=True, threaded=True, processes=1)
\ No newline at end of file
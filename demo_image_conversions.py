@@ -7,12 +7,33 @@ Practical demonstration of image format conversions with real examples.
 """
 
 import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE))
 
 from src.cli.main import convert
 
 
+# Image format conversions exercised by the demo: (from, to, description)
+_CONVERSIONS = (
+    ('png', 'jpeg', '📸 PNG to JPEG (removes transparency)'),
+    ('png', 'bmp', '🖼️ PNG to BMP (uncompressed)'),
+    ('png', 'gif', '🎞️ PNG to GIF (palette mode)'),
+    ('png', 'webp', '🌐 PNG to WebP (modern format)'),
+    ('png', 'tiff', '📷 PNG to TIFF (high quality)'),
+    ('png', 'ico', '⚡ PNG to ICO (icon format)'),
+)
+
+
+def _safe(func, *args):
+    """Call func(*args), returning the raised exception instead of propagating it."""
+    try:
+        return func(*args)
+    except Exception as e:
+        return e
+
+
 def demo_image_conversions():
     """Demonstrate image conversions with sample data."""
     print("🖼️  Image Conversion Demonstration")
@@ -25,32 +46,35 @@ def demo_image_conversions():
     print("🎨 Testing with sample PNG image (1x1 transparent pixel)")
     print(f"📋 Sample PNG (base64): {sample_png_base64[:50]}...")
     
-    # Demonstrate various image format conversions
-    conversions_to_test = [
-        ('png', 'jpeg', '📸 PNG to JPEG (removes transparency)'),
-        ('png', 'bmp', '🖼️ PNG to BMP (uncompressed)'),
-        ('png', 'gif', '🎞️ PNG to GIF (palette mode)'),
-        ('png', 'webp', '🌐 PNG to WebP (modern format)'),
-        ('png', 'tiff', '📷 PNG to TIFF (high quality)'),
-        ('png', 'ico', '⚡ PNG to ICO (icon format)'),
-    ]
+    n_conversions = len(_CONVERSIONS)
+    print(f"\n🔄 Testing {n_conversions} image format conversions:")
     
-    print(f"\n🔄 Testing {len(conversions_to_test)} image format conversions:")
+    # Run every conversion up front, then report in a single pass
+    _conv = convert
+    outcomes = {
+        f"{from_fmt}_to_{to_fmt}": _safe(_conv, sample_png_base64, from_fmt, to_fmt)
+        for from_fmt, to_fmt, _ in _CONVERSIONS
+    }
     
     results = {}
-    for from_fmt, to_fmt, description in conversions_to_test:
-        try:
-            print(f"\n   {description}")
-            result = convert(sample_png_base64, from_fmt, to_fmt)
-            
-            # Store result and show preview
-            results[f"{from_fmt}_to_{to_fmt}"] = result
-            result_preview = result[:60] + "..." if len(result) > 60 else result
-            print(f"   ✅ Success: {result_preview}")
-            print(f"   📏 Output size: {len(result)} characters")
-            
-        except Exception as e:
-            print(f"   ❌ Failed: {str(e)}")
+    for from_fmt, to_fmt, description in _CONVERSIONS:
+        key = f"{from_fmt}_to_{to_fmt}"
+        result = outcomes[key]
+        print(f"\n   {description}")
+        if isinstance(result, Exception):
+            print(f"   ❌ Failed: {result}")
+            continue
+        
+        # Store result and show preview (image -> image results are raw bytes)
+        results[key] = result
+        if isinstance(result, bytes):
+            result_preview = result[:30].hex() + ("..." if len(result) > 30 else "")
+            unit = "bytes"
+        else:
+            result_preview = result[:60] + ("..." if len(result) > 60 else "")
+            unit = "characters"
+        print(f"   ✅ Success: {result_preview}")
+        print(f"   📏 Output size: {len(result)} {unit}")
     
     # Test reverse conversions
     print(f"\n🔄 Testing reverse conversions:")
@@ -75,7 +99,7 @@ def demo_image_conversions():
     print(f"\n🚀 Web Interface Available:")
     print(f"   Open the Flask web app to try image conversions")
     print(f"   Upload image data as base64 or use the examples")
-    print(f"   All {len(conversions_to_test)} conversion types supported in GUI!")
+    print(f"   All {n_conversions} conversion types supported in GUI!")
 
 
 if __name__ == "__main__":
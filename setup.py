@@ -7,28 +7,25 @@ This allows the package to be installed as a proper Python package:
 """
 
 from setuptools import setup, find_packages
-import os
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
 
 # Read the README file for long description
-def read_readme():
-    readme_path = os.path.join(os.path.dirname(__file__), 'README.md')
-    if os.path.exists(readme_path):
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            return f.read()
+def read_readme(here=_HERE):
+    readme_path = here / 'README.md'
+    if readme_path.exists():
+        return readme_path.read_text(encoding='utf-8')
     return "Universal File Operator - Educational Python Project"
 
 # Read requirements from requirements.txt
-def read_requirements():
-    req_path = os.path.join(os.path.dirname(__file__), 'requirements.txt')
-    requirements = []
-    if os.path.exists(req_path):
-        with open(req_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if line and not line.startswith('#'):
-                    requirements.append(line)
-    return requirements
+def read_requirements(here=_HERE):
+    req_path = here / 'requirements.txt'
+    if not req_path.exists():
+        return []
+    with open(req_path, 'r', encoding='utf-8') as f:
+        # Skip comments and empty lines
+        return [s for line in f if (s := line.strip()) and not s.startswith('#')]
 
 setup(
     name="universal-format-converter",
@@ -51,7 +48,8 @@ setup(
     entry_points={
         'console_scripts': [
             'convert=src.cli.main:main',
-            'converter-web=src.web.app:main',
+            'converter-web=src.web.app:main',            # Flask dev server
+            'converter-web-prod=src.web.wsgi:serve',     # Production WSGI server
         ],
     },
     
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 from flask import Flask, request, jsonify
-import json
 
 app = Flask(__name__)
 
@@ -22,4 +21,7 @@ def simple_test():
 
 if __name__ == '__main__':
     print("Starting simple Flask server on port 5002...")
-    app.run(host='127.0.0.1', port=5002, debug=False)
\ No newline at end of file
+    # Threaded so concurrent test POSTs don't queue behind each other.
+    # For real throughput use a production WSGI server instead, e.g.
+    # waitress.serve(app, host='127.0.0.1', port=5002, threads=8)
+    app.run(host='127.0.0.1', port=5002, debug=False, threaded=True, processes=1)
\ No newline at end of file
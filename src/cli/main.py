@@ -16,34 +16,158 @@ Learning Concepts:
 
 import click
 import sys
+import os
+import re
+import base64
+import contextlib
+import importlib.util
 from pathlib import Path
 from typing import Optional
 import logging
 
-# Rich for beautiful output
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.progress import Progress
-    from rich.text import Text
-    RICH_AVAILABLE = True
-    console = Console()
-except ImportError:
-    RICH_AVAILABLE = False
-    console = None
+
+class _LazyConsole:
+    """
+    Stand-in for a Rich Console that imports and creates it on first use.
+    
+    Importing rich.console is a large share of the CLI's startup time, and
+    one-shot commands that fail early or write plain output never need it.
+    """
+    
+    def __init__(self):
+        self._console = None
+    
+    def _get(self):
+        if self._console is None:
+            from rich.console import Console
+            # No auto-highlighting or hard wrapping: results are often long
+            # base64/hex strings that must stay intact for copy and paste
+            self._console = Console(highlight=False, soft_wrap=True)
+        return self._console
+    
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+    
+    def __enter__(self):
+        return self._get().__enter__()
+    
+    def __exit__(self, *exc_info):
+        return self._get().__exit__(*exc_info)
+
+
+# Rich for beautiful output (probed without importing it)
+RICH_AVAILABLE = importlib.util.find_spec('rich') is not None
+console = _LazyConsole() if RICH_AVAILABLE else None
 
 # Import our converter system
 try:
     from ..converters.registry import get_global_registry, convert, list_conversions
+    from ..utils.cleaning import HEX_SEPARATORS, clean_hex, strip_whitespace
     from ..utils.exceptions import ConversionError, UnsupportedFormatError, ValidationError
 except ImportError:
     # Handle relative import issues during development
     import os
     sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
     from src.converters.registry import get_global_registry, convert, list_conversions
+    from src.utils.cleaning import HEX_SEPARATORS, clean_hex, strip_whitespace
     from src.utils.exceptions import ConversionError, UnsupportedFormatError, ValidationError
 
 
+# Formats offered by the CLI commands and the interactive menu
+FORMATS = (
+    'binary', 'base64', 'hex', 'text', 'url_encoded', 'html_encoded',
+    'json', 'dict', 'decimal', 'md5', 'sha256'
+)
+
+# Shared by every --from/--to option
+_FORMAT_CHOICE = click.Choice(FORMATS)
+
+# Numbered format menu shown by interactive mode
+_FORMAT_MENU = "\n".join(f"  {i:2d}. {fmt}" for i, fmt in enumerate(FORMATS, 1))
+
+# A menu answer: an optionally signed whole number, surrounding spaces allowed
+_CHOICE_RE = re.compile(r'\s*([+-]?\d+)\s*\Z')
+
+
+# Text -> bytes conversions that convert-file streams chunk by chunk instead
+# of reading the whole file: {(from, to): (clean, block_size, decode)}.
+# Each chunk goes through the converter's own cleanup function, then is
+# decoded in whole blocks; a partial block carries over to the next chunk.
+_STREAM_DECODERS = {
+    ('base64', 'binary'): (strip_whitespace, 4, base64.b64decode),
+    ('hex', 'binary'): (clean_hex, 2, bytes.fromhex),
+}
+
+# Characters read per streamed chunk (a multiple of both block sizes)
+_STREAM_CHUNK = 768 * 1024
+
+
+def _stream_decode_file(input_path: str, output_path: str, from_format: str,
+                        to_format: str, encoding: str) -> None:
+    """
+    Convert a text-encoded file to raw bytes without loading it whole.
+    
+    Peak memory stays around one chunk no matter how large the file is.
+    A partially written output file is removed if decoding fails.
+    """
+    clean, block_size, decode = _STREAM_DECODERS[(from_format, to_format)]
+    
+    try:
+        with open(input_path, 'r', encoding=encoding) as src, open(output_path, 'wb') as dst:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+            held = ''    # raw trailing '0' (plus separators) that may start a split '0x'
+            pending = ''  # cleaned characters short of a whole block
+            for chunk in iter(lambda: src.read(_STREAM_CHUNK), ''):
+                text = held + chunk
+                held = ''
+                # Separators are dropped before '0x' is, so '0' + separators + 'x'
+                # also forms a prefix; hold the whole run for the next chunk
+                stripped = text.rstrip(HEX_SEPARATORS)
+                if stripped.endswith('0'):
+                    text, held = stripped[:-1], text[len(stripped) - 1:]
+                
+                data = pending + clean(text)
+                cut = len(data) - len(data) % block_size
+                dst.write(decode(data[:cut]))
+                pending = data[cut:]
+            
+            data = pending + clean(held)
+            if data:
+                dst.write(decode(data))
+    except BaseException:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+
+
+@contextlib.contextmanager
+def _batched_output():
+    """
+    Hold a command's output and write it out together when it finishes.
+    
+    Rich output is kept in the console's buffer. Plain output is
+    block-buffered by switching off stdout's line buffering until the
+    command returns, then flushed once.
+    """
+    if RICH_AVAILABLE:
+        with console:
+            yield
+        return
+    
+    stream = sys.stdout
+    line_buffering = getattr(stream, 'line_buffering', False)
+    if line_buffering:
+        stream.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        stream.flush()
+        if line_buffering:
+            stream.reconfigure(line_buffering=True)
+
+
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -67,25 +191,22 @@ def cli(ctx, verbose):
     ctx.obj['verbose'] = verbose
     setup_logging(verbose)
     
-    if RICH_AVAILABLE:
-        console.print("🔄 [bold blue]Universal File Operator[/bold blue]", style="bold")
-    else:
-        print("🔄 Universal File Operator")
+    # The banner is only for people at a terminal using the chatty commands;
+    # one-shot and piped runs go straight to their output
+    if sys.stdout.isatty() and ctx.invoked_subcommand in (None, 'interactive', 'demo'):
+        if RICH_AVAILABLE:
+            console.print("🔄 [bold blue]Universal File Operator[/bold blue]", style="bold")
+        else:
+            print("🔄 Universal File Operator")
 
 
 @cli.command()
 @click.argument('data')
 @click.option('--from', 'from_format', 
-              type=click.Choice([
-                  'binary', 'base64', 'hex', 'text', 'url_encoded', 'html_encoded',
-                  'json', 'dict', 'decimal', 'md5', 'sha256'
-              ]), 
+              type=_FORMAT_CHOICE, 
               required=True, help='Source format')
 @click.option('--to', 'to_format', 
-              type=click.Choice([
-                  'binary', 'base64', 'hex', 'text', 'url_encoded', 'html_encoded',
-                  'json', 'dict', 'decimal', 'md5', 'sha256'
-              ]), 
+              type=_FORMAT_CHOICE, 
               required=True, help='Target format')
 @click.option('--output', '-o', help='Output file (default: print to stdout)')
 @click.option('--indent', type=int, help='Indentation for formatted output (JSON)')
@@ -105,19 +226,26 @@ def convert_data(ctx, data, from_format, to_format, output, indent, uppercase, i
         convert-data '{"name": "John"}' --from json --to yaml
     """
     try:
-        # Prepare conversion options
-        options = {}
-        if indent is not None:
-            options['indent'] = indent
-        if encoding != 'utf-8':
-            options['encoding'] = encoding
-        if uppercase:
-            options['uppercase'] = True
-        if include_prefix:
-            options['include_prefix'] = True
+        # Prepare conversion options (none in the common case)
+        options = None
+        if indent is not None or encoding != 'utf-8' or uppercase or include_prefix:
+            options = {}
+            if indent is not None:
+                options['indent'] = indent
+            if encoding != 'utf-8':
+                options['encoding'] = encoding
+            if uppercase:
+                options['uppercase'] = True
+            if include_prefix:
+                options['include_prefix'] = True
         
-        # Perform conversion
-        result = convert(data, from_format, to_format, **options)
+        # Perform conversion (same-format requests return the input as-is)
+        if from_format == to_format:
+            result = data
+        elif options is None:
+            result = convert(data, from_format, to_format)
+        else:
+            result = convert(data, from_format, to_format, **options)
         
         # Output result
         if output:
@@ -127,12 +255,13 @@ def convert_data(ctx, data, from_format, to_format, output, indent, uppercase, i
             else:
                 print(f"✅ Conversion saved to {output}")
         else:
+            # Heading and result go out in a single write
             if RICH_AVAILABLE:
-                console.print("📤 [bold]Result:[/bold]")
-                console.print(result)
+                with console:
+                    console.print("📤 [bold]Result:[/bold]")
+                    console.print(result)
             else:
-                print("📤 Result:")
-                print(result)
+                print("📤 Result:", result, sep="\n")
                 
     except UnsupportedFormatError as e:
         if RICH_AVAILABLE:
@@ -161,16 +290,10 @@ def convert_data(ctx, data, from_format, to_format, output, indent, uppercase, i
 @cli.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.option('--from', 'from_format', 
-              type=click.Choice([
-                  'binary', 'base64', 'hex', 'text', 'url_encoded', 'html_encoded',
-                  'json', 'dict', 'decimal', 'md5', 'sha256'
-              ]), 
+              type=_FORMAT_CHOICE, 
               required=True, help='Source format')
 @click.option('--to', 'to_format', 
-              type=click.Choice([
-                  'binary', 'base64', 'hex', 'text', 'url_encoded', 'html_encoded',
-                  'json', 'dict', 'decimal', 'md5', 'sha256'
-              ]), 
+              type=_FORMAT_CHOICE, 
               required=True, help='Target format')
 @click.option('--output', '-o', help='Output file (default: input_file.converted)')
 @click.option('--encoding', default='utf-8', help='Text encoding')
@@ -185,37 +308,45 @@ def convert_file(ctx, input_file, from_format, to_format, output, encoding):
         convert-file image.base64 --from base64 --to binary -o image.bin
     """
     try:
-        # Read input file
-        input_path = Path(input_file)
+        # Plain os.path string handling; nothing here needs Path objects
+        input_name = os.path.basename(input_file)
+        output_path = output or f"{os.path.splitext(input_name)[0]}.{to_format}"
+        output_name = os.path.basename(output_path)
         
-        if from_format in ['binary', 'base64'] and to_format in ['binary']:
-            # Handle binary files
-            data = input_path.read_bytes()
-        else:
-            data = input_path.read_text(encoding=encoding)
-        
-        if RICH_AVAILABLE:
-            console.print(f"📖 Reading {input_path.name}...")
-        
-        # Perform conversion
-        result = convert(data, from_format, to_format)
-        
-        # Determine output file
-        if not output:
-            output = f"{input_path.stem}.{to_format}"
-        
-        output_path = Path(output)
-        
-        # Write result
-        if isinstance(result, bytes):
-            output_path.write_bytes(result)
+        # Decode large text-encoded files in chunks, unless writing over the input
+        if ((from_format, to_format) in _STREAM_DECODERS
+                and os.path.realpath(output_path) != os.path.realpath(input_file)):
+            if RICH_AVAILABLE:
+                console.print(f"📖 Reading {input_name}...")
+            _stream_decode_file(input_file, output_path, from_format, to_format, encoding)
         else:
-            output_path.write_text(str(result), encoding=encoding)
+            # Read input file
+            if from_format in ['binary', 'base64'] and to_format in ['binary']:
+                # Handle binary files
+                with open(input_file, 'rb') as f:
+                    data = f.read()
+            else:
+                with open(input_file, 'r', encoding=encoding) as f:
+                    data = f.read()
+            
+            if RICH_AVAILABLE:
+                console.print(f"📖 Reading {input_name}...")
+            
+            # Perform conversion
+            result = convert(data, from_format, to_format)
+            
+            # Write result
+            if isinstance(result, bytes):
+                with open(output_path, 'wb') as f:
+                    f.write(result)
+            else:
+                with open(output_path, 'w', encoding=encoding) as f:
+                    f.write(str(result))
         
         if RICH_AVAILABLE:
-            console.print(f"✅ [green]Converted {input_path.name} → {output_path.name}[/green]")
+            console.print(f"✅ [green]Converted {input_name} → {output_name}[/green]")
         else:
-            print(f"✅ Converted {input_path.name} → {output_path.name}")
+            print(f"✅ Converted {input_name} → {output_name}")
             
     except Exception as e:
         if RICH_AVAILABLE:
@@ -228,6 +359,7 @@ def convert_file(ctx, input_file, from_format, to_format, output, encoding):
 @cli.command()
 @click.option('--format', 'format_filter', help='Filter by format name')
 @click.option('--output-format', type=click.Choice(['table', 'json']), default='table', help='Output format')
+@_batched_output()
 def list_formats(format_filter, output_format):
     """
     List all supported conversion formats and pairs.
@@ -241,12 +373,12 @@ def list_formats(format_filter, output_format):
     try:
         conversions = list_conversions()
         
-        # Apply filter if specified
+        # Apply filter if specified (registered format names are already lowercase)
         if format_filter:
+            needle = format_filter.lower()
             conversions = [
                 conv for conv in conversions 
-                if format_filter.lower() in conv['from'].lower() or 
-                   format_filter.lower() in conv['to'].lower()
+                if needle in conv['from'] or needle in conv['to']
             ]
         
         if output_format == 'json':
@@ -256,6 +388,8 @@ def list_formats(format_filter, output_format):
         
         # Table format
         if RICH_AVAILABLE:
+            from rich.table import Table
+            
             table = Table(title="🔄 Supported Conversions")
             table.add_column("From", style="cyan")
             table.add_column("To", style="magenta")
@@ -293,6 +427,25 @@ def list_formats(format_filter, output_format):
         sys.exit(1)
 
 
+def _read_choice(formats, prompt: str, invalid_msg: str) -> Optional[str]:
+    """
+    Ask for a menu number and return the chosen format.
+    
+    Returns None (after telling the user why) when the answer is not a
+    number or is out of range.
+    """
+    match = _CHOICE_RE.match(input(prompt))
+    if match is None:
+        print("❌ Please enter a valid number")
+        return None
+    
+    choice = int(match.group(1))
+    if 1 <= choice <= len(formats):
+        return formats[choice - 1]
+    print(invalid_msg)
+    return None
+
+
 @cli.command()
 def interactive():
     """
@@ -301,28 +454,26 @@ def interactive():
     This provides a user-friendly interface for multiple conversions
     with guided format selection.
     """
-    formats = [
-        'binary', 'base64', 'hex', 'text', 'url_encoded', 'html_encoded',
-        'json', 'dict', 'decimal', 'md5', 'sha256'
-    ]
+    formats = FORMATS
+    menu = _FORMAT_MENU
     
+    # Prompts are the same on every turn
+    prompt = f"   Enter number (1-{len(formats)}): "
+    invalid_msg = f"❌ Invalid choice. Please enter a number between 1 and {len(formats)}"
+    
+    # Write the header and format menu as a single block
     if RICH_AVAILABLE:
-        console.print("🎮 [bold blue]Interactive Conversion Mode[/bold blue]")
-        console.print("Type 'quit' or 'exit' to stop\n")
-        
-        # Show available formats
-        console.print("📋 [bold]Available Formats:[/bold]")
-        for i, fmt in enumerate(formats, 1):
-            console.print(f"  {i:2d}. {fmt}")
-        console.print()
+        console.print(
+            "🎮 [bold blue]Interactive Conversion Mode[/bold blue]\n"
+            "Type 'quit' or 'exit' to stop\n\n"
+            f"📋 [bold]Available Formats:[/bold]\n{menu}\n"
+        )
     else:
-        print("🎮 Interactive Conversion Mode")
-        print("Type 'quit' or 'exit' to stop\n")
-        
-        print("📋 Available Formats:")
-        for i, fmt in enumerate(formats, 1):
-            print(f"  {i:2d}. {fmt}")
-        print()
+        print(
+            "🎮 Interactive Conversion Mode\n"
+            "Type 'quit' or 'exit' to stop\n\n"
+            f"📋 Available Formats:\n{menu}\n"
+        )
     
     while True:
         try:
@@ -333,43 +484,32 @@ def interactive():
             
             # Get format information with number selection
             print("📥 Select source format:")
-            try:
-                from_choice = int(input("   Enter number (1-{}): ".format(len(formats))))
-                if 1 <= from_choice <= len(formats):
-                    from_format = formats[from_choice - 1]
-                else:
-                    print("❌ Invalid choice. Please enter a number between 1 and", len(formats))
-                    continue
-            except ValueError:
-                print("❌ Please enter a valid number")
+            from_format = _read_choice(formats, prompt, invalid_msg)
+            if from_format is None:
                 continue
             
             print("📤 Select target format:")
-            try:
-                to_choice = int(input("   Enter number (1-{}): ".format(len(formats))))
-                if 1 <= to_choice <= len(formats):
-                    to_format = formats[to_choice - 1]
-                else:
-                    print("❌ Invalid choice. Please enter a number between 1 and", len(formats))
-                    continue
-            except ValueError:
-                print("❌ Please enter a valid number")
+            to_format = _read_choice(formats, prompt, invalid_msg)
+            if to_format is None:
                 continue
             
             # Show selected conversion
             print(f"🔄 Converting: {from_format} → {to_format}")
             
-            # Perform conversion
-            result = convert(data, from_format, to_format)
+            # Perform conversion (same-format requests return the input as-is)
+            if from_format == to_format:
+                result = data
+            else:
+                result = convert(data, from_format, to_format)
             
+            # Result plus an empty line for spacing, in one write
             if RICH_AVAILABLE:
-                console.print("✅ [green]Result:[/green]")
-                console.print(result)
+                with console:  # buffer the prints and flush them together
+                    console.print("✅ [green]Result:[/green]")
+                    console.print(result)
+                    console.print()
             else:
-                print("✅ Result:")
-                print(result)
-            
-            print()  # Empty line for spacing
+                print("✅ Result:", result, sep="\n", end="\n\n")
             
         except KeyboardInterrupt:
             break
@@ -388,6 +528,7 @@ def interactive():
 
 @cli.command()
 @click.option('--samples', type=int, default=5, help='Number of sample conversions to show')
+@_batched_output()
 def demo(samples):
     """
     Run a demonstration of various conversions.
@@ -411,27 +552,24 @@ def demo(samples):
     else:
         print("🎯 Conversion Demonstration\n")
     
+    # Each example is written in one call once its conversion has finished
     for i, (data, from_fmt, to_fmt) in enumerate(demo_data[:samples]):
         try:
-            if RICH_AVAILABLE:
-                console.print(f"[cyan]Example {i+1}:[/cyan] {from_fmt} → {to_fmt}")
-                console.print(f"  Input:  {data}")
-            else:
-                print(f"Example {i+1}: {from_fmt} → {to_fmt}")
-                print(f"  Input:  {data}")
-            
             result = convert(data, from_fmt, to_fmt)
-            
             if RICH_AVAILABLE:
-                console.print(f"  Output: [green]{result}[/green]\n")
+                outcome = f"  Output: [green]{result}[/green]\n"
             else:
-                print(f"  Output: {result}\n")
-                
+                outcome = f"  Output: {result}\n"
         except Exception as e:
             if RICH_AVAILABLE:
-                console.print(f"  [red]Error: {e}[/red]\n")
+                outcome = f"  [red]Error: {e}[/red]\n"
             else:
-                print(f"  Error: {e}\n")
+                outcome = f"  Error: {e}\n"
+        
+        if RICH_AVAILABLE:
+            console.print(f"[cyan]Example {i+1}:[/cyan] {from_fmt} → {to_fmt}\n  Input:  {data}\n{outcome}")
+        else:
+            print(f"Example {i+1}: {from_fmt} → {to_fmt}\n  Input:  {data}\n{outcome}")
 
 
 def main():
@@ -80,4 +80,8 @@ def _load_converters():
                 print(f"Warning: Could not load converter module {name}: {e}")
 
 # Load converters when the package is imported
-_load_converters()
\ No newline at end of file
+_load_converters()
+
+# All built-in converters are registered now; freeze the global format graph
+from .registry import get_global_registry
+get_global_registry().freeze()
\ No newline at end of file
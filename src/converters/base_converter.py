@@ -15,7 +15,7 @@ Learning Concepts:
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
 import logging
-from ..utils.exceptions import ConversionError, ValidationError, handle_conversion_error
+from ..utils.exceptions import ConversionError, ValidationError, translate_error
 
 # Set up logging for the converter
 logger = logging.getLogger(__name__)
@@ -117,7 +117,6 @@ class BaseConverter(ABC):
         
         return options.copy()  # Return a copy to avoid modifying the original
     
-    @handle_conversion_error
     def convert(self, data: Any, **options) -> Any:
         """
         Public method to convert data from source to target format.
@@ -144,9 +143,14 @@ class BaseConverter(ABC):
         """
         logger.info(f"Starting conversion: {self.from_format} -> {self.to_format}")
         
-        # Validate inputs
-        self.validate_input(data)
-        validated_options = self.validate_options(options)
+        # Validate inputs, translating built-in errors into ConversionError types
+        try:
+            self.validate_input(data)
+            validated_options = self.validate_options(options)
+        except ConversionError:
+            raise
+        except Exception as e:
+            raise translate_error(e) from e
         
         # Log conversion details
         data_info = f"{type(data).__name__}"
@@ -23,41 +23,310 @@ Learning Concepts:
 - Error handling for image processing
 """
 
-from PIL import Image, ImageSequence
+from __future__ import annotations
+
 import io
+import re
 import base64
-from typing import Dict, Any, Optional, Union
+import binascii
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterator, List, Optional, Union
 import os
 
 from .base_converter import BaseConverter
 from .registry import register_converter
+from ..utils.cleaning import clean_hex
 from ..utils.exceptions import ConversionError, ValidationError
 
 
+def _get_pil():
+    """
+    Import Pillow's Image module and bind it as this module's Image global.
+    
+    Pillow and its codec extensions are only loaded once a converter actually
+    decodes or encodes pixels; passthrough paths (base64/hex of image bytes,
+    magic-byte validation) never import it.
+    """
+    global Image
+    from PIL import Image as pil_image
+    Image = pil_image
+    return pil_image
+
+
+class _LazyPIL:
+    """Stand-in for PIL.Image that imports Pillow on first attribute access."""
+    
+    def __getattr__(self, name):
+        return getattr(_get_pil(), name)
+
+
+Image = _LazyPIL()
+
+# simplejpeg (libjpeg-turbo) is optional; JPEG decoding falls back to Pillow without it
+try:
+    import simplejpeg
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    SIMPLEJPEG_AVAILABLE = False
+
+# pyvips (libvips) is optional; large image-to-image transcodes use it when present
+try:
+    import pyvips
+    PYVIPS_AVAILABLE = True
+except (ImportError, OSError):
+    PYVIPS_AVAILABLE = False
+
+# Inputs above this size go through libvips (below it, vips startup costs more than it saves)
+_VIPS_THRESHOLD = 4 * 1024 * 1024
+
+# Formats libvips can write without ImageMagick, with their buffer suffixes
+_VIPS_SUFFIX = {'jpeg': '.jpg', 'png': '.png', 'gif': '.gif', 'tiff': '.tif', 'webp': '.webp'}
+
+
+# Pillow TIFF compression names that libvips spells differently
+_VIPS_TIFF_COMPRESSION = {'raw': 'none', 'tiff_lzw': 'lzw', 'tiff_deflate': 'deflate',
+                          'tiff_adobe_deflate': 'deflate'}
+
+
+def _convert_via_vips(src_bytes: bytes, dst_fmt: str, **kw) -> bytes:
+    """Transcode encoded image bytes to dst_fmt with libvips' streaming pipeline."""
+    image = pyvips.Image.new_from_buffer(src_bytes, '', access='sequential')
+    save_options = {}
+    if dst_fmt == 'jpeg':
+        # JPEG has no alpha channel: flatten onto white like _flatten_to_rgb
+        if image.hasalpha():
+            image = image.flatten(background=[255, 255, 255])
+        # Same defaults as the Pillow path: progressive, optimized, 4:2:0
+        save_options.update(Q=kw.get('quality', 85), interlace=True,
+                            optimize_coding=True, subsample_mode='on')
+    elif dst_fmt == 'png':
+        save_options['compression'] = kw.get('compress_level', 1)
+    elif dst_fmt == 'webp':
+        save_options['Q'] = kw.get('quality', ImageConverter.default_quality)
+    elif dst_fmt == 'tiff':
+        compression = kw.get('compression', 'tiff_lzw') or 'raw'
+        save_options['compression'] = _VIPS_TIFF_COMPRESSION.get(compression, compression)
+    return image.write_to_buffer(_VIPS_SUFFIX[dst_fmt], **save_options)
+
+
+# pybase64 (SIMD codec) is optional; the stdlib base64 module is used without it
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+
+if PYBASE64_AVAILABLE:
+    def _enc_b64(data) -> str:
+        """Base64-encode a bytes-like object and return it as a str."""
+        return pybase64.b64encode_as_string(data)
+    
+    def _dec_b64(data) -> bytes:
+        """Decode base64 leniently (non-alphabet characters are discarded)."""
+        return pybase64.b64decode(data, validate=False)
+else:
+    def _enc_b64(data) -> str:
+        """Base64-encode a bytes-like object and return it as a str."""
+        return base64.b64encode(data).decode('ascii')
+    
+    def _dec_b64(data) -> bytes:
+        """Decode base64 leniently (non-alphabet characters are discarded)."""
+        return base64.b64decode(data)
+
+
+def _stream_b64_encode(path: str, chunk: int = 57 * 1024) -> str:
+    """
+    Base64-encode a file without reading it into memory in one piece.
+    
+    The chunk size is a multiple of 3 bytes, so every chunk encodes without
+    padding and the pieces concatenate to the same result as one-shot encoding.
+    """
+    parts = []
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk), b''):
+            parts.append(_enc_b64(block))
+    return ''.join(parts)
+
+
+def _stream_hex(path: str, chunk: int = 65536) -> str:
+    """Hex-encode a file chunk by chunk instead of reading it in one piece."""
+    parts = []
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk), b''):
+            parts.append(binascii.hexlify(block).decode('ascii'))
+    return ''.join(parts)
+
+
+# Worker pool shared by every convert_batch call, created on first use
+_BATCH_POOL: Optional[ThreadPoolExecutor] = None
+_BATCH_POOL_LOCK = threading.Lock()
+
+
+def _batch_pool() -> ThreadPoolExecutor:
+    """Return the shared convert_batch pool (one thread per CPU)."""
+    global _BATCH_POOL
+    with _BATCH_POOL_LOCK:
+        if _BATCH_POOL is None:
+            _BATCH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                             thread_name_prefix='image-batch')
+        return _BATCH_POOL
+
+
+_JPEG_SOI = b'\xff\xd8\xff'
+
+def _to_palette(image: Image.Image) -> Image.Image:
+    """
+    Reduce an image to a 256-colour palette for GIF.
+    
+    Uses Pillow's fast octree quantizer (RGB/RGBA input only, so other modes
+    are converted first) without dithering, like the ADAPTIVE palette did.
+    """
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    return image.quantize(colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+
+
+# Base64 alphabet (plus padding and line breaks), checked on a short prefix only
+_BASE64_PREFIX_RE = re.compile(r'[A-Za-z0-9+/=\s]+')
+
+
+def _is_probable_base64(data: str) -> bool:
+    """Cheap check for whether a string looks like base64 rather than a file path."""
+    return len(data) % 4 == 0 and _BASE64_PREFIX_RE.fullmatch(data[:256]) is not None
+
+
+def _encode_jpeg(image: Image.Image, quality: int, optimize: bool = False,
+                 progressive: bool = False, subsampling: int = -1) -> bytes:
+    """Encode an RGB image as JPEG with Pillow."""
+    output_buffer = io.BytesIO()
+    image.save(output_buffer, format='JPEG', quality=quality, optimize=optimize,
+               progressive=progressive, subsampling=subsampling)
+    return output_buffer.getvalue()
+
+
+# APPn segments Pillow keeps on decode but simplejpeg drops: (marker, signature)
+_JPEG_METADATA = ((0xE1, b'Exif\x00\x00'), (0xE2, b'ICC_PROFILE\x00'))
+
+
+def _has_jpeg_metadata(image_bytes: bytes) -> bool:
+    """
+    Check whether a JPEG carries an EXIF block or ICC profile.
+    
+    Walks the marker segments up to the start of scan; anything that does
+    not parse cleanly counts as having metadata.
+    """
+    pos, end = 2, len(image_bytes)
+    while pos + 4 <= end:
+        if image_bytes[pos] != 0xFF:
+            return True
+        marker = image_bytes[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before the marker
+            pos += 1
+            continue
+        if marker == 0xDA:
+            return False
+        length = int.from_bytes(image_bytes[pos + 2:pos + 4], 'big')
+        for app_marker, signature in _JPEG_METADATA:
+            if marker == app_marker and image_bytes.startswith(signature, pos + 4):
+                return True
+        pos += 2 + length
+    return True
+
+
+def _decode_jpeg(image_bytes: bytes) -> Optional[Image.Image]:
+    """
+    Decode JPEG bytes with simplejpeg, or return None to let Pillow handle them.
+    
+    Only colour (YCbCr) JPEGs without EXIF or an ICC profile are taken, so
+    the result matches what Image.open gives. Grayscale, CMYK and anything
+    simplejpeg rejects (12-bit, truncated data) go through Pillow as before.
+    """
+    if not SIMPLEJPEG_AVAILABLE or not image_bytes.startswith(_JPEG_SOI):
+        return None
+    try:
+        if simplejpeg.decode_jpeg_header(image_bytes)[2] != 'YCbCr':
+            return None
+        if _has_jpeg_metadata(image_bytes):
+            return None
+        return Image.fromarray(simplejpeg.decode_jpeg(image_bytes, colorspace='RGB'))
+    except ValueError:
+        return None
+
+
+# Leading magic bytes of each encoded image format, checked by _sniff_format
+_MAGIC_PREFIXES = (
+    (_JPEG_SOI, 'jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+    (b'BM', 'bmp'),
+    (b'II*\x00', 'tiff'),
+    (b'MM\x00*', 'tiff'),
+    (b'\x00\x00\x01\x00', 'ico'),
+)
+
+
+# Pillow save() options per format for _image_to_bytes: fmt -> f(kwargs, converter)
+_SAVE_KW: Dict[str, Callable[[Dict[str, Any], Any], Dict[str, Any]]] = {
+    # Fast zlib level 1 for one-shot transcodes; optimize_size=True asks for level 9
+    'png': lambda kw, c: (
+        {'optimize': True} if kw.get('optimize_size')
+        else {'compress_level': kw.get('compress_level', 1)}
+    ),
+    'webp': lambda kw, c: {'quality': kw.get('quality', c.default_quality), 'method': kw.get('method', 6)},
+    'tiff': lambda kw, c: {'compression': kw.get('compression', 'tiff_lzw')},
+}
+
+
+# Conventional multi-resolution icon sizes (the same set Pillow writes by default)
+_ICO_SIZES = [(s, s) for s in (16, 24, 32, 48, 64, 128, 256)]
+
+
+def _ico_pyramid(image: Image.Image, sizes) -> Dict[str, Any]:
+    """
+    Build ICO save options that resample the source image only once.
+    
+    The image is shrunk to the largest requested size (at most 256) with
+    LANCZOS, then each size that is exactly half the previous level is made
+    with a 2x box reduce. Pillow thumbnails any other size from the largest
+    level, which it picks up as the last appended image. Palette and bilevel
+    images are converted to RGBA first, since they cannot be box-reduced.
+    """
+    if image.mode in ('1', 'P'):
+        image = image.convert('RGBA')
+    sizes = sorted(set(sizes))
+    sides = {w for w, h in sizes if w == h}
+    top = min(max(max(size) for size in sizes), 256)
+    level = image.copy()
+    level.thumbnail((top, top), Image.Resampling.LANCZOS)
+    levels = [level]
+    while level.width == level.height and level.width // 2 in sides and level.width > 1:
+        level = level.reduce(2)
+        levels.append(level)
+    return {'sizes': sizes, 'append_images': levels[::-1]}
+
+
+def _to_target_mode(image: Image.Image, fmt: str, target_mode: str) -> Image.Image:
+    """Convert an image to the mode _image_to_bytes saves fmt in."""
+    if image.mode == target_mode:
+        return image
+    if target_mode == 'RGB' and image.mode == 'RGBA':
+        # Handle transparency for RGB formats
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    if target_mode == 'P' and fmt == 'gif':
+        # Convert to palette mode for GIF
+        return _to_palette(image)
+    return image.convert(target_mode)
+
+
 class ImageConverter(BaseConverter):
     """Base class for all image converters with common functionality."""
-
-# JPEG to binary (01 string) converter
-@register_converter("jpeg", "binary")
-class JpegToBinaryConverter(ImageConverter):
-    """Convert JPEG image to binary (01 string) representation."""
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert JPEG to binary string (01 representation)."""
-        if isinstance(data, str):
-            # If it's a file path
-            if os.path.exists(data):
-                with open(data, 'rb') as f:
-                    image_bytes = f.read()
-            else:
-                # Try as base64
-                try:
-                    image_bytes = base64.b64decode(data)
-                except:
-                    raise ValidationError("Invalid JPEG data provided")
-        else:
-            image_bytes = data
-        # Convert bytes to 01 string
-        return ''.join(f'{byte:08b}' for byte in image_bytes)
     
     SUPPORTED_FORMATS = {
         'jpeg': {'extensions': ['.jpg', '.jpeg'], 'mime': 'image/jpeg', 'mode': 'RGB'},
@@ -69,18 +338,19 @@ class JpegToBinaryConverter(ImageConverter):
         'ico': {'extensions': ['.ico'], 'mime': 'image/x-icon', 'mode': 'RGBA'},
     }
     
-    def __init__(self, from_format: str, to_format: str):
-        super().__init__(from_format, to_format)
-        self.default_quality = 85
-        self.default_optimize = True
+    default_quality = 85
+    default_optimize = True
     
     def _load_image_from_data(self, data: Union[str, bytes]) -> Image.Image:
         """Load PIL Image from various data formats."""
         try:
             if isinstance(data, str):
+                # Strings that cannot be base64 are opened as paths without decoding
+                if not _is_probable_base64(data) and os.path.exists(data):
+                    return Image.open(data)
                 # Try to decode as base64 first
                 try:
-                    image_bytes = base64.b64decode(data)
+                    image_bytes = _dec_b64(data)
                 except Exception:
                     # If not base64, treat as file path
                     if os.path.exists(data):
@@ -91,8 +361,9 @@ class JpegToBinaryConverter(ImageConverter):
                 image_bytes = data
             
             # Load from bytes
-            image_buffer = io.BytesIO(image_bytes)
-            image = Image.open(image_buffer)
+            image = _decode_jpeg(image_bytes)
+            if image is None:
+                image = Image.open(io.BytesIO(image_bytes))
             return image
             
         except Exception as e:
@@ -101,374 +372,205 @@ class JpegToBinaryConverter(ImageConverter):
     def _image_to_bytes(self, image: Image.Image, format_name: str, **kwargs) -> bytes:
         """Convert PIL Image to bytes in specified format."""
         try:
-            output_buffer = io.BytesIO()
+            fmt = format_name.lower()
             
             # Get format info
-            format_info = self.SUPPORTED_FORMATS.get(format_name.lower())
+            format_info = self.SUPPORTED_FORMATS.get(fmt)
             if not format_info:
                 raise ValidationError(f"Unsupported image format: {format_name}")
             
             # Convert image mode if needed
-            target_mode = format_info['mode']
-            if image.mode != target_mode:
-                if target_mode == 'RGB' and image.mode == 'RGBA':
-                    # Handle transparency for RGB formats
-                    background = Image.new('RGB', image.size, (255, 255, 255))
-                    background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-                    image = background
-                elif target_mode == 'P' and format_name.lower() == 'gif':
-                    # Convert to palette mode for GIF
-                    image = image.convert('P', palette=Image.ADAPTIVE)
-                else:
-                    image = image.convert(target_mode)
+            image = _to_target_mode(image, fmt, format_info['mode'])
+            
+            if fmt == 'jpeg':
+                # Progressive, Huffman-optimized 4:2:0 unless the caller overrides
+                return _encode_jpeg(
+                    image,
+                    kwargs.get('quality', self.default_quality),
+                    kwargs.get('optimize', self.default_optimize),
+                    kwargs.get('progressive', True),
+                    kwargs.get('subsampling', 2),
+                )
             
             # Set format-specific parameters
-            save_kwargs = {}
-            if format_name.lower() == 'jpeg':
-                save_kwargs.update({
-                    'quality': kwargs.get('quality', self.default_quality),
-                    'optimize': kwargs.get('optimize', self.default_optimize)
-                })
-            elif format_name.lower() == 'png':
-                save_kwargs.update({
-                    'optimize': kwargs.get('optimize', self.default_optimize)
-                })
-            elif format_name.lower() == 'webp':
-                save_kwargs.update({
-                    'quality': kwargs.get('quality', self.default_quality),
-                    'method': kwargs.get('method', 6)
-                })
-            elif format_name.lower() == 'tiff':
-                save_kwargs.update({
-                    'compression': kwargs.get('compression', 'lzw')
-                })
+            if fmt == 'ico' and 'sizes' in kwargs:
+                save_kwargs = _ico_pyramid(image, kwargs['sizes'])
+            else:
+                save_kwargs = _SAVE_KW[fmt](kwargs, self) if fmt in _SAVE_KW else {}
             
             # Save image to buffer
-            image.save(output_buffer, format=format_name.upper(), **save_kwargs)
+            output_buffer = io.BytesIO()
+            image.save(output_buffer, format=_FMT_UPPER[fmt], **save_kwargs)
             return output_buffer.getvalue()
             
         except Exception as e:
             raise ConversionError(f"Failed to convert image to {format_name}: {str(e)}")
-
-
-# JPEG Converters
-@register_converter("jpeg", "png")
-class JpegToPngConverter(ImageConverter):
-    """Convert JPEG images to PNG format (adds transparency support)."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert JPEG to PNG and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        # Convert to RGBA for PNG transparency support
-        if image.mode != 'RGBA':
-            image = image.convert('RGBA')
-        
-        png_bytes = self._image_to_bytes(image, 'png')
-        return base64.b64encode(png_bytes).decode('utf-8')
-
-
-@register_converter("png", "jpeg")
-class PngToJpegConverter(ImageConverter):
-    """Convert PNG images to JPEG format (removes transparency)."""
     
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert PNG to JPEG and return as base64."""
-        image = self._load_image_from_data(data)
+    def convert_batch(self, items: List[Union[str, bytes]], max_workers: Optional[int] = None,
+                      **options) -> List[Any]:
+        """
+        Convert several images with this converter on a shared thread pool.
         
-        jpeg_bytes = self._image_to_bytes(image, 'jpeg', quality=90)
-        return base64.b64encode(jpeg_bytes).decode('utf-8')
-
-
-@register_converter("jpeg", "webp")
-class JpegToWebpConverter(ImageConverter):
-    """Convert JPEG to WebP format (better compression)."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert JPEG to WebP and return as base64."""
-        image = self._load_image_from_data(data)
+        Pillow releases the GIL while decoding and encoding, so the images
+        are processed in parallel. Results come back in input order; the
+        error of the first failing item (in input order) is raised.
         
-        webp_bytes = self._image_to_bytes(image, 'webp', quality=80, method=6)
-        return base64.b64encode(webp_bytes).decode('utf-8')
-
-
-@register_converter("webp", "jpeg")
-class WebpToJpegConverter(ImageConverter):
-    """Convert WebP to JPEG format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert WebP to JPEG and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        jpeg_bytes = self._image_to_bytes(image, 'jpeg', quality=90)
-        return base64.b64encode(jpeg_bytes).decode('utf-8')
-
-
-# PNG Converters
-@register_converter("png", "gif")
-class PngToGifConverter(ImageConverter):
-    """Convert PNG to GIF format (adds palette mode)."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert PNG to GIF and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        gif_bytes = self._image_to_bytes(image, 'gif')
-        return base64.b64encode(gif_bytes).decode('utf-8')
-
-
-@register_converter("gif", "png")
-class GifToPngConverter(ImageConverter):
-    """Convert GIF to PNG format (preserves transparency)."""
+        Args:
+            items: Image data accepted by convert() (bytes, base64 or file paths)
+            max_workers: Size of a dedicated pool for this call (by default the
+                module's shared pool, one thread per CPU, is used)
+            **options: Conversion options passed to every convert() call
+        """
+        if len(items) <= 1:
+            return [self.convert(item, **options) for item in items]
+        convert = functools.partial(self.convert, **options)
+        if max_workers is None:
+            return list(_batch_pool().map(convert, items))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(convert, items))
     
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert GIF to PNG and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        # Convert palette mode to RGBA for PNG
-        if image.mode == 'P':
-            image = image.convert('RGBA')
+    def convert_chain(self, data: Union[str, bytes], fmt_chain: List[str], **options) -> str:
+        """
+        Convert an image through a chain of formats, encoding only the last one.
         
-        png_bytes = self._image_to_bytes(image, 'png')
-        return base64.b64encode(png_bytes).decode('utf-8')
-
-
-# BMP Converters
-@register_converter("bmp", "png")
-class BmpToPngConverter(ImageConverter):
-    """Convert BMP to PNG format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert BMP to PNG and return as base64."""
-        image = self._load_image_from_data(data)
+        The image is decoded once. Intermediate formats only apply their mode
+        change (e.g. flattening transparency for JPEG, palette reduction for
+        GIF) instead of a full encode/decode round-trip.
         
-        png_bytes = self._image_to_bytes(image, 'png')
-        return base64.b64encode(png_bytes).decode('utf-8')
-
-
-@register_converter("png", "bmp")
-class PngToBmpConverter(ImageConverter):
-    """Convert PNG to BMP format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert PNG to BMP and return as base64."""
-        image = self._load_image_from_data(data)
+        Args:
+            data: Image data (bytes, base64 or file path)
+            fmt_chain: Target formats in order, e.g. ['png', 'webp']
+            **options: Encoding options for the final format
+            
+        Returns:
+            The final image as a base64 string
+        """
+        if not fmt_chain:
+            raise ValidationError("Format chain must contain at least one format")
+        for fmt in fmt_chain:
+            if fmt.lower() not in self.SUPPORTED_FORMATS:
+                raise ValidationError(f"Unsupported image format: {fmt}")
         
-        bmp_bytes = self._image_to_bytes(image, 'bmp')
-        return base64.b64encode(bmp_bytes).decode('utf-8')
-
-
-@register_converter("bmp", "jpeg")
-class BmpToJpegConverter(ImageConverter):
-    """Convert BMP to JPEG format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert BMP to JPEG and return as base64."""
         image = self._load_image_from_data(data)
+        for fmt in fmt_chain[:-1]:
+            fmt = fmt.lower()
+            image = _to_target_mode(image, fmt, self.SUPPORTED_FORMATS[fmt]['mode'])
         
-        jpeg_bytes = self._image_to_bytes(image, 'jpeg', quality=90)
-        return base64.b64encode(jpeg_bytes).decode('utf-8')
-
-
-@register_converter("jpeg", "bmp")
-class JpegToBmpConverter(ImageConverter):
-    """Convert JPEG to BMP format."""
+        return _enc_b64(self._image_to_bytes(image, fmt_chain[-1], **options))
     
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert JPEG to BMP and return as base64."""
-        image = self._load_image_from_data(data)
+    def _to_hex(self, data: Union[str, bytes], label: str) -> str:
+        """Hex-encode image bytes given directly, as a file path or as base64."""
+        if isinstance(data, str):
+            # If it's a file path
+            if os.path.exists(data):
+                return _stream_hex(data)
+            # Try as base64
+            try:
+                image_bytes = _dec_b64(data)
+            except Exception:
+                raise ValidationError(f"Invalid {label} data provided")
+        else:
+            image_bytes = data
         
-        bmp_bytes = self._image_to_bytes(image, 'bmp')
-        return base64.b64encode(bmp_bytes).decode('utf-8')
-
-
-# TIFF Converters
-@register_converter("tiff", "png")
-class TiffToPngConverter(ImageConverter):
-    """Convert TIFF to PNG format."""
+        return binascii.hexlify(image_bytes).decode('ascii')
     
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert TIFF to PNG and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        png_bytes = self._image_to_bytes(image, 'png')
-        return base64.b64encode(png_bytes).decode('utf-8')
-
+    @staticmethod
+    def _sniff_format(image_bytes: bytes) -> Optional[str]:
+        """Identify an encoded image from its magic bytes, or return None."""
+        if image_bytes[:4] == b'RIFF' and image_bytes[8:12] == b'WEBP':
+            return 'webp'
+        for prefix, fmt in _MAGIC_PREFIXES:
+            if image_bytes.startswith(prefix):
+                return fmt
+        return None
 
-@register_converter("png", "tiff")
-class PngToTiffConverter(ImageConverter):
-    """Convert PNG to TIFF format."""
-    
+# JPEG to binary (01 string) converter
+@register_converter("jpeg", "binary")
+class JpegToBinaryConverter(ImageConverter):
+    """Convert JPEG image to binary (01 string) representation."""
     def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert PNG to TIFF and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        tiff_bytes = self._image_to_bytes(image, 'tiff', compression='lzw')
-        return base64.b64encode(tiff_bytes).decode('utf-8')
+        """Convert JPEG to binary string (01 representation)."""
+        if isinstance(data, str):
+            # If it's a file path
+            if os.path.exists(data):
+                with open(data, 'rb') as f:
+                    image_bytes = f.read()
+            else:
+                # Try as base64
+                try:
+                    image_bytes = _dec_b64(data)
+                except:
+                    raise ValidationError("Invalid JPEG data provided")
+        else:
+            image_bytes = data
+        # Convert bytes to 01 string
+        return ''.join(f'{byte:08b}' for byte in image_bytes)
 
 
-@register_converter("tiff", "jpeg")
-class TiffToJpegConverter(ImageConverter):
-    """Convert TIFF to JPEG format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert TIFF to JPEG and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        jpeg_bytes = self._image_to_bytes(image, 'jpeg', quality=90)
-        return base64.b64encode(jpeg_bytes).decode('utf-8')
+# Per-pair preparation steps used by the image -> image table at the end of the module
+def _to_rgba(image: Image.Image) -> Image.Image:
+    """Convert to RGBA for PNG transparency support."""
+    return image if image.mode == 'RGBA' else image.convert('RGBA')
 
 
-@register_converter("jpeg", "tiff")
-class JpegToTiffConverter(ImageConverter):
-    """Convert JPEG to TIFF format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert JPEG to TIFF and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        tiff_bytes = self._image_to_bytes(image, 'tiff', compression='lzw')
-        return base64.b64encode(tiff_bytes).decode('utf-8')
+def _palette_to_rgba(image: Image.Image) -> Image.Image:
+    """Convert palette mode to RGBA for PNG."""
+    return image.convert('RGBA') if image.mode == 'P' else image
 
 
-# WebP Converters
-@register_converter("webp", "png")
-class WebpToPngConverter(ImageConverter):
-    """Convert WebP to PNG format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert WebP to PNG and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        png_bytes = self._image_to_bytes(image, 'png')
-        return base64.b64encode(png_bytes).decode('utf-8')
+def _first_frame(image: Image.Image) -> Image.Image:
+    """For animated images, take the first frame."""
+    if getattr(image, 'is_animated', False):
+        image.seek(0)
+    return image
 
 
-@register_converter("png", "webp")
-class PngToWebpConverter(ImageConverter):
-    """Convert PNG to WebP format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert PNG to WebP and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        webp_bytes = self._image_to_bytes(image, 'webp', quality=80, method=6)
-        return base64.b64encode(webp_bytes).decode('utf-8')
+def _fit_icon(image: Image.Image) -> Image.Image:
+    """Shrink images larger than the biggest ICO size (256x256)."""
+    if image.width > 256 or image.height > 256:
+        image.thumbnail((256, 256), Image.Resampling.LANCZOS)
+    return image
 
 
-# ICO Converters
-@register_converter("ico", "png")
-class IcoToPngConverter(ImageConverter):
-    """Convert ICO (icon) to PNG format."""
+def _make_encoder(dst: str, prepare: Optional[Callable[[Image.Image], Image.Image]] = None,
+                  **encode_kwargs) -> Callable[[Image.Image], bytes]:
+    """
+    Specialize ImageConverter._image_to_bytes(image, dst, **encode_kwargs).
     
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert ICO to PNG and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        # ICO files can contain multiple sizes, use the largest
-        if hasattr(image, 'size'):
-            png_bytes = self._image_to_bytes(image, 'png')
-        else:
-            # Handle multi-frame ICO
-            largest_frame = max(ImageSequence.Iterator(image), key=lambda x: x.size[0] * x.size[1])
-            png_bytes = self._image_to_bytes(largest_frame, 'png')
-        
-        return base64.b64encode(png_bytes).decode('utf-8')
-
-
-@register_converter("png", "ico")
-class PngToIcoConverter(ImageConverter):
-    """Convert PNG to ICO format."""
+    The mode conversion, format name and save options are resolved once here,
+    so the returned encoder only converts the mode and saves. prepare replaces
+    the conversion to dst's SUPPORTED_FORMATS mode when given.
+    """
+    if prepare is None:
+        target_mode = ImageConverter.SUPPORTED_FORMATS[dst]['mode']
+        prepare = lambda image: _to_target_mode(image, dst, target_mode)
     
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert PNG to ICO and return as base64."""
-        image = self._load_image_from_data(data)
+    if dst == 'jpeg':
+        jpeg_args = (
+            encode_kwargs.get('quality', ImageConverter.default_quality),
+            encode_kwargs.get('optimize', ImageConverter.default_optimize),
+            encode_kwargs.get('progressive', True),
+            encode_kwargs.get('subsampling', 2),
+        )
         
-        # Resize to common ICO sizes if too large
-        max_size = 256
-        if image.width > max_size or image.height > max_size:
-            image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        def encode(image: Image.Image) -> bytes:
+            return _encode_jpeg(prepare(image), *jpeg_args)
+    else:
+        pil_format = dst.upper()
+        save_kwargs = _SAVE_KW[dst](encode_kwargs, ImageConverter) if dst in _SAVE_KW else {}
         
-        ico_bytes = self._image_to_bytes(image, 'ico')
-        return base64.b64encode(ico_bytes).decode('utf-8')
-
-
-# Additional format converters
-@register_converter("gif", "jpeg")
-class GifToJpegConverter(ImageConverter):
-    """Convert GIF to JPEG format (first frame only)."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert GIF to JPEG and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        # For animated GIFs, take the first frame
-        if getattr(image, 'is_animated', False):
-            image.seek(0)
+        ico_sizes = encode_kwargs.get('sizes') if dst == 'ico' else None
         
-        jpeg_bytes = self._image_to_bytes(image, 'jpeg', quality=90)
-        return base64.b64encode(jpeg_bytes).decode('utf-8')
-
-
-@register_converter("jpeg", "gif")
-class JpegToGifConverter(ImageConverter):
-    """Convert JPEG to GIF format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert JPEG to GIF and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        gif_bytes = self._image_to_bytes(image, 'gif')
-        return base64.b64encode(gif_bytes).decode('utf-8')
-
-
-# Cross-format converters
-@register_converter("bmp", "gif")
-class BmpToGifConverter(ImageConverter):
-    """Convert BMP to GIF format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert BMP to GIF and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        gif_bytes = self._image_to_bytes(image, 'gif')
-        return base64.b64encode(gif_bytes).decode('utf-8')
-
-
-@register_converter("gif", "bmp")
-class GifToBmpConverter(ImageConverter):
-    """Convert GIF to BMP format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert GIF to BMP and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        bmp_bytes = self._image_to_bytes(image, 'bmp')
-        return base64.b64encode(bmp_bytes).decode('utf-8')
-
-
-@register_converter("webp", "gif")
-class WebpToGifConverter(ImageConverter):
-    """Convert WebP to GIF format."""
-    
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert WebP to GIF and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        gif_bytes = self._image_to_bytes(image, 'gif')
-        return base64.b64encode(gif_bytes).decode('utf-8')
-
-
-@register_converter("gif", "webp")
-class GifToWebpConverter(ImageConverter):
-    """Convert GIF to WebP format."""
+        def encode(image: Image.Image) -> bytes:
+            output_buffer = io.BytesIO()
+            image = prepare(image)
+            if ico_sizes is not None:
+                image.save(output_buffer, format=pil_format, **_ico_pyramid(image, ico_sizes))
+            else:
+                image.save(output_buffer, format=pil_format, **save_kwargs)
+            return output_buffer.getvalue()
     
-    def _convert(self, data: Union[str, bytes], **options) -> str:
-        """Convert GIF to WebP and return as base64."""
-        image = self._load_image_from_data(data)
-        
-        webp_bytes = self._image_to_bytes(image, 'webp', quality=80, method=6)
-        return base64.b64encode(webp_bytes).decode('utf-8')
+    return encode
 
 
 # Utility converters
@@ -479,11 +581,9 @@ class ImageToBase64Converter(ImageConverter):
     def _convert(self, data: Union[str, bytes], **options) -> str:
         """Convert image to base64 string."""
         if isinstance(data, str) and os.path.exists(data):
-            with open(data, 'rb') as f:
-                image_bytes = f.read()
-            return base64.b64encode(image_bytes).decode('utf-8')
+            return _stream_b64_encode(data)
         elif isinstance(data, bytes):
-            return base64.b64encode(data).decode('utf-8')
+            return _enc_b64(data)
         else:
             raise ValidationError("Invalid image data provided")
 
@@ -495,12 +595,14 @@ class Base64ToImageConverter(ImageConverter):
     def _convert(self, data: str, **options) -> bytes:
         """Convert base64 to image bytes."""
         try:
-            image_bytes = base64.b64decode(data)
+            image_bytes = _dec_b64(data)
             
-            # Validate that it's actually an image
-            image_buffer = io.BytesIO(image_bytes)
-            image = Image.open(image_buffer)
-            image.verify()  # Verify it's a valid image
+            # Known magic bytes are enough unless a full check is requested
+            if options.get('strict') or self._sniff_format(image_bytes) is None:
+                # Validate that it's actually an image
+                image_buffer = io.BytesIO(image_bytes)
+                image = Image.open(image_buffer)
+                image.verify()  # Verify it's a valid image
             
             return image_bytes
         except Exception as e:
@@ -515,7 +617,11 @@ class Base64ToJpegConverter(ImageConverter):
         """Convert base64 to JPEG bytes."""
         try:
             # Decode base64 to bytes
-            image_bytes = base64.b64decode(data)
+            image_bytes = _dec_b64(data)
+            
+            # Already a JPEG and no re-encode requested: return it untouched
+            if 'quality' not in options and self._sniff_format(image_bytes) == 'jpeg':
+                return image_bytes
             
             # Open the image
             image_buffer = io.BytesIO(image_bytes)
@@ -528,7 +634,7 @@ class Base64ToJpegConverter(ImageConverter):
                 if image.mode == 'P':
                     image = image.convert('RGBA')
                 if image.mode == 'RGBA':
-                    background.paste(image, mask=image.split()[-1])
+                    background.paste(image, mask=image.getchannel('A'))
                 else:
                     background.paste(image)
                 image = background
@@ -536,11 +642,7 @@ class Base64ToJpegConverter(ImageConverter):
                 image = image.convert('RGB')
             
             # Save as JPEG
-            output_buffer = io.BytesIO()
-            quality = options.get('quality', 95)
-            image.save(output_buffer, format='JPEG', quality=quality, optimize=True)
-            
-            return output_buffer.getvalue()
+            return _encode_jpeg(image, options.get('quality', 95), optimize=True)
         except Exception as e:
             raise ConversionError(f"Failed to convert base64 to JPEG: {str(e)}")
 
@@ -553,7 +655,11 @@ class Base64ToPngConverter(ImageConverter):
         """Convert base64 to PNG bytes."""
         try:
             # Decode base64 to bytes
-            image_bytes = base64.b64decode(data)
+            image_bytes = _dec_b64(data)
+            
+            # Already a PNG: nothing to re-encode
+            if self._sniff_format(image_bytes) == 'png':
+                return image_bytes
             
             # Open the image
             image_buffer = io.BytesIO(image_bytes)
@@ -576,7 +682,7 @@ class Base64ToGifConverter(ImageConverter):
         """Convert base64 to GIF bytes."""
         try:
             # Decode base64 to bytes
-            image_bytes = base64.b64decode(data)
+            image_bytes = _dec_b64(data)
             
             # Open the image
             image_buffer = io.BytesIO(image_bytes)
@@ -584,7 +690,7 @@ class Base64ToGifConverter(ImageConverter):
             
             # Convert to appropriate mode for GIF
             if image.mode not in ('P', 'L'):
-                image = image.convert('P', palette=Image.ADAPTIVE)
+                image = _to_palette(image)
             
             # Save as GIF
             output_buffer = io.BytesIO()
@@ -603,7 +709,7 @@ class Base64ToBmpConverter(ImageConverter):
         """Convert base64 to BMP bytes."""
         try:
             # Decode base64 to bytes
-            image_bytes = base64.b64decode(data)
+            image_bytes = _dec_b64(data)
             
             # Open the image
             image_buffer = io.BytesIO(image_bytes)
@@ -613,7 +719,7 @@ class Base64ToBmpConverter(ImageConverter):
             if image.mode in ('RGBA', 'LA'):
                 background = Image.new('RGB', image.size, (255, 255, 255))
                 if image.mode == 'RGBA':
-                    background.paste(image, mask=image.split()[-1])
+                    background.paste(image, mask=image.getchannel('A'))
                 else:
                     background.paste(image)
                 image = background
@@ -637,7 +743,7 @@ class Base64ToWebpConverter(ImageConverter):
         """Convert base64 to WebP bytes."""
         try:
             # Decode base64 to bytes
-            image_bytes = base64.b64decode(data)
+            image_bytes = _dec_b64(data)
             
             # Open the image
             image_buffer = io.BytesIO(image_bytes)
@@ -661,7 +767,7 @@ class Base64ToTiffConverter(ImageConverter):
         """Convert base64 to TIFF bytes."""
         try:
             # Decode base64 to bytes
-            image_bytes = base64.b64decode(data)
+            image_bytes = _dec_b64(data)
             
             # Open the image
             image_buffer = io.BytesIO(image_bytes)
@@ -669,7 +775,7 @@ class Base64ToTiffConverter(ImageConverter):
             
             # Save as TIFF
             output_buffer = io.BytesIO()
-            compression = options.get('compression', 'lzw')
+            compression = options.get('compression', 'tiff_lzw')
             image.save(output_buffer, format='TIFF', compression=compression)
             
             return output_buffer.getvalue()
@@ -685,7 +791,7 @@ class Base64ToIcoConverter(ImageConverter):
         """Convert base64 to ICO bytes."""
         try:
             # Decode base64 to bytes
-            image_bytes = base64.b64decode(data)
+            image_bytes = _dec_b64(data)
             
             # Open the image
             image_buffer = io.BytesIO(image_bytes)
@@ -710,27 +816,25 @@ class Base64ToIcoConverter(ImageConverter):
 
 
 # Image to Hex Converters
+def yield_hex(image_bytes: bytes, chunk: int = 65536) -> Iterator[str]:
+    """
+    Yield the hex encoding of image_bytes in pieces of 2 * chunk characters.
+    
+    Lets callers stream large images to a file or socket without building
+    the whole hex string in memory.
+    """
+    view = memoryview(image_bytes)
+    for start in range(0, len(view), chunk):
+        yield view[start:start + chunk].hex()
+
+
 @register_converter("png", "hex")
 class PngToHexConverter(ImageConverter):
     """Convert PNG image to hexadecimal representation."""
     
     def _convert(self, data: Union[str, bytes], **options) -> str:
         """Convert PNG to hex string."""
-        if isinstance(data, str):
-            # If it's a file path
-            if os.path.exists(data):
-                with open(data, 'rb') as f:
-                    image_bytes = f.read()
-            else:
-                # Try as base64
-                try:
-                    image_bytes = base64.b64decode(data)
-                except:
-                    raise ValidationError("Invalid PNG data provided")
-        else:
-            image_bytes = data
-        
-        return image_bytes.hex()
+        return self._to_hex(data, 'PNG')
 
 
 @register_converter("jpeg", "hex")
@@ -739,21 +843,7 @@ class JpegToHexConverter(ImageConverter):
     
     def _convert(self, data: Union[str, bytes], **options) -> str:
         """Convert JPEG to hex string."""
-        if isinstance(data, str):
-            # If it's a file path
-            if os.path.exists(data):
-                with open(data, 'rb') as f:
-                    image_bytes = f.read()
-            else:
-                # Try as base64
-                try:
-                    image_bytes = base64.b64decode(data)
-                except:
-                    raise ValidationError("Invalid JPEG data provided")
-        else:
-            image_bytes = data
-        
-        return image_bytes.hex()
+        return self._to_hex(data, 'JPEG')
 
 
 @register_converter("gif", "hex")
@@ -762,21 +852,7 @@ class GifToHexConverter(ImageConverter):
     
     def _convert(self, data: Union[str, bytes], **options) -> str:
         """Convert GIF to hex string."""
-        if isinstance(data, str):
-            # If it's a file path
-            if os.path.exists(data):
-                with open(data, 'rb') as f:
-                    image_bytes = f.read()
-            else:
-                # Try as base64
-                try:
-                    image_bytes = base64.b64decode(data)
-                except:
-                    raise ValidationError("Invalid GIF data provided")
-        else:
-            image_bytes = data
-        
-        return image_bytes.hex()
+        return self._to_hex(data, 'GIF')
 
 
 @register_converter("bmp", "hex")
@@ -785,21 +861,7 @@ class BmpToHexConverter(ImageConverter):
     
     def _convert(self, data: Union[str, bytes], **options) -> str:
         """Convert BMP to hex string."""
-        if isinstance(data, str):
-            # If it's a file path
-            if os.path.exists(data):
-                with open(data, 'rb') as f:
-                    image_bytes = f.read()
-            else:
-                # Try as base64
-                try:
-                    image_bytes = base64.b64decode(data)
-                except:
-                    raise ValidationError("Invalid BMP data provided")
-        else:
-            image_bytes = data
-        
-        return image_bytes.hex()
+        return self._to_hex(data, 'BMP')
 
 
 @register_converter("webp", "hex")
@@ -808,21 +870,7 @@ class WebpToHexConverter(ImageConverter):
     
     def _convert(self, data: Union[str, bytes], **options) -> str:
         """Convert WebP to hex string."""
-        if isinstance(data, str):
-            # If it's a file path
-            if os.path.exists(data):
-                with open(data, 'rb') as f:
-                    image_bytes = f.read()
-            else:
-                # Try as base64
-                try:
-                    image_bytes = base64.b64decode(data)
-                except:
-                    raise ValidationError("Invalid WebP data provided")
-        else:
-            image_bytes = data
-        
-        return image_bytes.hex()
+        return self._to_hex(data, 'WebP')
 
 
 @register_converter("tiff", "hex")
@@ -831,21 +879,7 @@ class TiffToHexConverter(ImageConverter):
     
     def _convert(self, data: Union[str, bytes], **options) -> str:
         """Convert TIFF to hex string."""
-        if isinstance(data, str):
-            # If it's a file path
-            if os.path.exists(data):
-                with open(data, 'rb') as f:
-                    image_bytes = f.read()
-            else:
-                # Try as base64
-                try:
-                    image_bytes = base64.b64decode(data)
-                except:
-                    raise ValidationError("Invalid TIFF data provided")
-        else:
-            image_bytes = data
-        
-        return image_bytes.hex()
+        return self._to_hex(data, 'TIFF')
 
 
 @register_converter("ico", "hex")
@@ -854,69 +888,102 @@ class IcoToHexConverter(ImageConverter):
     
     def _convert(self, data: Union[str, bytes], **options) -> str:
         """Convert ICO to hex string."""
-        if isinstance(data, str):
-            # If it's a file path
-            if os.path.exists(data):
-                with open(data, 'rb') as f:
-                    image_bytes = f.read()
-            else:
-                # Try as base64
-                try:
-                    image_bytes = base64.b64decode(data)
-                except:
-                    raise ValidationError("Invalid ICO data provided")
-        else:
-            image_bytes = data
-        
-        return image_bytes.hex()
+        return self._to_hex(data, 'ICO')
 
 
 # --- DYNAMIC CONVERTER REGISTRATION (must be after all imports/classes) ---
+IMAGE_FORMATS = ("jpeg", "png", "gif", "bmp", "tiff", "webp", "ico")
+
+# PIL format names, computed once instead of calling fmt.upper() on every save
+_FMT_UPPER = {fmt: fmt.upper() for fmt in IMAGE_FORMATS}
+
+
+def _identity(image: Image.Image) -> Image.Image:
+    """Return the image unchanged (formats that accept any mode)."""
+    return image
+
+
+def _flatten_to_rgb(image: Image.Image) -> Image.Image:
+    """Flatten transparency onto a white background and return an RGB image."""
+    if image.mode in ('RGBA', 'LA', 'P'):
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        # Create white background and use the alpha channel as mask
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    if image.mode != 'RGB':
+        return image.convert('RGB')
+    return image
+
+
+# Per-format mode preparation applied before saving; formats not listed use _identity
+_FMT_HANDLERS: Dict[str, Callable[[Image.Image], Image.Image]] = {
+    'jpeg': _flatten_to_rgb,
+}
+
+
 # Helper functions for dynamic converters
+def _binstr_to_bytes(data: str) -> bytes:
+    """
+    Pack a validated binary (01) string into bytes.
+    
+    The string is treated as one big-endian integer, so int() and to_bytes()
+    do the packing in C instead of slicing and parsing every 8 characters.
+    Strings that are not a multiple of 8 bits are left-padded with zeros.
+    """
+    if not data:
+        return b''
+    return int(data, 2).to_bytes((len(data) + 7) // 8, 'big')
+
+
+def _bytes_to_binstr(data: bytes) -> str:
+    """Expand bytes into a binary (01) string, 8 characters per byte."""
+    if not data:
+        return ''
+    return format(int.from_bytes(data, 'big'), f'0{len(data) * 8}b')
+
+
+def _save_as_buffer(image: Image.Image, fmt: str) -> memoryview:
+    """
+    Save an image and return a view of the encoded data without copying it.
+    
+    Use this when the consumer accepts the buffer protocol (base64, hex,
+    hashing). Converters that hand the result back to callers should keep
+    returning bytes.
+    """
+    output = io.BytesIO()
+    image.save(output, format=_FMT_UPPER[fmt])
+    return output.getbuffer()
+
+
 def _binary_to_image(data, fmt):
     """Convert binary string (01) to image format."""
     if not isinstance(data, str):
         data = str(data)
     # Remove any whitespace and common separators
     data = data.replace(' ', '').replace('\n', '').replace('\r', '').replace('\t', '')
-    # Validate binary string
-    invalid_chars = [c for c in data if c not in '01']
+    # Validate binary string (set difference scans the string in C)
+    invalid_chars = set(data).difference('01')
     if invalid_chars:
         # Get first few invalid characters for error message
-        invalid_sample = ''.join(set(invalid_chars))[:10]
+        invalid_sample = ''.join(invalid_chars)[:10]
         raise ValidationError(f"Input contains invalid characters: '{invalid_sample}'. Only 0 and 1 are allowed.")
-    # Convert binary string to bytes
-    if len(data) % 8 != 0:
-        # Pad with zeros if needed
-        padding = 8 - (len(data) % 8)
-        data = '0' * padding + data
-    image_bytes = bytes(int(data[i:i+8], 2) for i in range(0, len(data), 8))
+    # Convert binary string to bytes (left-padded with zeros to whole bytes)
+    image_bytes = _binstr_to_bytes(data)
     
     # Load and convert image
     try:
         image = Image.open(io.BytesIO(image_bytes))
         output = io.BytesIO()
         
-        # Handle JPEG format specifically (requires RGB mode)
-        if fmt.lower() == 'jpeg':
-            if image.mode in ('RGBA', 'LA', 'P'):
-                # Convert to RGB for JPEG
-                if image.mode == 'P':
-                    image = image.convert('RGBA')
-                # Create white background
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                if image.mode == 'RGBA' or image.mode == 'LA':
-                    background.paste(image, mask=image.split()[-1])  # Use alpha channel as mask
-                else:
-                    background.paste(image)
-                image = background
-            elif image.mode != 'RGB':
-                image = image.convert('RGB')
+        # Apply format-specific mode preparation (e.g. RGB flattening for JPEG)
+        image = _FMT_HANDLERS.get(fmt, _identity)(image)
         
-        image.save(output, format=fmt.upper())
+        image.save(output, format=_FMT_UPPER[fmt])
         return output.getvalue()
     except Exception as e:
-        raise ConversionError(f"Failed to convert binary to {fmt.upper()} image: {str(e)}")
+        raise ConversionError(f"Failed to convert binary to {_FMT_UPPER[fmt]} image: {str(e)}")
 
 def _hex_to_image(data, fmt):
     """Convert hex string to image format."""
@@ -936,26 +1003,13 @@ def _hex_to_image(data, fmt):
         image = Image.open(io.BytesIO(image_bytes))
         output = io.BytesIO()
         
-        # Handle JPEG format specifically (requires RGB mode)
-        if fmt.lower() == 'jpeg':
-            if image.mode in ('RGBA', 'LA', 'P'):
-                # Convert to RGB for JPEG
-                if image.mode == 'P':
-                    image = image.convert('RGBA')
-                # Create white background
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                if image.mode == 'RGBA' or image.mode == 'LA':
-                    background.paste(image, mask=image.split()[-1])  # Use alpha channel as mask
-                else:
-                    background.paste(image)
-                image = background
-            elif image.mode != 'RGB':
-                image = image.convert('RGB')
+        # Apply format-specific mode preparation (e.g. RGB flattening for JPEG)
+        image = _FMT_HANDLERS.get(fmt, _identity)(image)
         
-        image.save(output, format=fmt.upper())
+        image.save(output, format=_FMT_UPPER[fmt])
         return output.getvalue()
     except Exception as e:
-        raise ConversionError(f"Failed to convert hex to {fmt.upper()} image: {str(e)}")
+        raise ConversionError(f"Failed to convert hex to {_FMT_UPPER[fmt]} image: {str(e)}")
 
 def _image_to_base64(data, fmt):
     """Convert image data to base64 string in specified format."""
@@ -966,14 +1020,13 @@ def _image_to_base64(data, fmt):
                 data = f.read()
         else:
             try:
-                data = base64.b64decode(data)
+                data = _dec_b64(data)
             except:
                 raise ValidationError("Invalid image data")
     
     image = Image.open(io.BytesIO(data))
-    output = io.BytesIO()
-    image.save(output, format=fmt.upper())
-    return base64.b64encode(output.getvalue()).decode('utf-8')
+    # The encoder reads the buffer in place, no intermediate bytes copy
+    return _enc_b64(_save_as_buffer(image, fmt))
 
 def _image_to_binary_bytes(data, fmt):
     """Convert image data to binary bytes in specified format."""
@@ -984,17 +1037,17 @@ def _image_to_binary_bytes(data, fmt):
                 data = f.read()
         else:
             try:
-                data = base64.b64decode(data)
+                data = _dec_b64(data)
             except:
                 raise ValidationError("Invalid image data")
     
     image = Image.open(io.BytesIO(data))
     output = io.BytesIO()
-    image.save(output, format=fmt.upper())
+    image.save(output, format=_FMT_UPPER[fmt])
     return output.getvalue()
 
 # Register dynamic converters for all image formats
-for fmt in ["jpeg", "png", "gif", "bmp", "tiff", "webp", "ico"]:
+for fmt in IMAGE_FORMATS:
     # Binary (01 string) to Image
     exec(f"""
 @register_converter('binary', '{fmt}')
@@ -1004,7 +1057,7 @@ class BinaryTo{fmt.capitalize()}Converter(ImageConverter):
         return _binary_to_image(data, '{fmt}')
 """, globals())
 
-for fmt in ["jpeg", "png", "gif", "bmp", "tiff", "webp", "ico"]:
+for fmt in IMAGE_FORMATS:
     # Hex to Image - now including JPEG
     exec(f"""
 @register_converter('hex', '{fmt}')
@@ -1015,7 +1068,7 @@ class HexTo{fmt.capitalize()}Converter(ImageConverter):
 """, globals())
 
 # Add image formats to base64 converters (reverse direction)
-for fmt in ["jpeg", "png", "gif", "bmp", "tiff", "webp", "ico"]:
+for fmt in IMAGE_FORMATS:
     exec(f"""
 @register_converter('{fmt}', 'base64')
 class {fmt.capitalize()}ToBase64Converter(ImageConverter):
@@ -1038,7 +1091,7 @@ class {fmt.capitalize()}ToBinaryConverter(ImageConverter):
                     image_bytes = f.read()
             else:
                 try:
-                    image_bytes = base64.b64decode(data)
+                    image_bytes = _dec_b64(data)
                 except:
                     raise ValidationError("Invalid image data")
         else:
@@ -1055,12 +1108,12 @@ class HexToBase64Converter(BaseConverter):
         if not isinstance(data, str):
             data = str(data)
         # Clean hex string
-        cleaned = data.replace('0x', '').replace(':', '').replace('-', '').replace(' ', '').replace('\\n', '').replace('\\r', '').replace('\\t', '')
+        cleaned = clean_hex(data)
         try:
             binary_data = bytes.fromhex(cleaned)
-            return base64.b64encode(binary_data).decode('utf-8')
+            return _enc_b64(binary_data)
         except ValueError as e:
-            raise ValidationError(f"Invalid hexadecimal string: {{str(e)}}")
+            raise ValidationError(f"Invalid hexadecimal string: {e}")
 
 @register_converter('base64', 'hex')
 class Base64ToHexConverter(BaseConverter):
@@ -1069,10 +1122,10 @@ class Base64ToHexConverter(BaseConverter):
         if not isinstance(data, str):
             data = str(data)
         try:
-            binary_data = base64.b64decode(data)
+            binary_data = _dec_b64(data)
             return binary_data.hex()
         except Exception as e:
-            raise ValidationError(f"Invalid base64 string: {{str(e)}}")
+            raise ValidationError(f"Invalid base64 string: {e}")
 
 # Add binary (01 string) ↔ hex converters
 @register_converter('binary', 'hex')  
@@ -1082,20 +1135,12 @@ class BinaryStringToHexConverter(BaseConverter):
         if not isinstance(data, str):
             data = str(data)
         # Remove whitespace
-        data = data.replace(' ', '').replace('\\n', '').replace('\\r', '').replace('\\t', '')
-        # Validate binary string
-        if not all(c in '01' for c in data):
+        data = data.replace(' ', '').replace('\n', '').replace('\r', '').replace('\t', '')
+        # Validate binary string (set difference scans the string in C)
+        if set(data).difference('01'):
             raise ValidationError("Input must be a binary string (only 0 and 1)")
-        # Pad if needed
-        if len(data) % 8 != 0:
-            padding = 8 - (len(data) % 8)
-            data = '0' * padding + data
-        # Convert to hex
-        hex_str = ''
-        for i in range(0, len(data), 8):
-            byte_val = int(data[i:i+8], 2)
-            hex_str += f'{{byte_val:02x}}'
-        return hex_str
+        # Pack to bytes (padded to whole bytes) and hex-encode
+        return _binstr_to_bytes(data).hex()
 
 @register_converter('hex', 'binary')
 class HexToBinaryStringConverter(BaseConverter):
@@ -1104,20 +1149,24 @@ class HexToBinaryStringConverter(BaseConverter):
         if not isinstance(data, str):
             data = str(data)
         # Clean hex string
-        cleaned = data.replace('0x', '').replace(':', '').replace('-', '').replace(' ', '').replace('\\n', '').replace('\\r', '').replace('\\t', '')
+        cleaned = data.replace('0x', '').replace(':', '').replace('-', '').replace(' ', '').replace('\n', '').replace('\r', '').replace('\t', '')
         try:
-            binary_str = ''
-            for i in range(0, len(cleaned), 2):
-                hex_byte = cleaned[i:i+2]
-                byte_val = int(hex_byte, 16)
-                binary_str += f'{{byte_val:08b}}'
-            return binary_str
+            return _bytes_to_binstr(bytes.fromhex(cleaned))
         except ValueError as e:
-            raise ValidationError(f"Invalid hexadecimal string: {{str(e)}}")
+            raise ValidationError(f"Invalid hexadecimal string: {str(e)}")
 
 # Helper function for generic image format conversion
-def _convert_image_format(data, from_fmt, to_fmt):
-    """Convert between any two image formats."""
+def _convert_image_format(data, from_fmt, to_fmt, encode, prepare=None, backend=None,
+                          **encode_kwargs):
+    """
+    Convert between any two image formats.
+    
+    encode is the pair's pre-resolved encoder (see _make_encoder) and prepare
+    an optional step applied to the decoded image first. backend='vips' asks
+    for libvips, backend='pil' forces Pillow; by default libvips handles
+    inputs larger than _VIPS_THRESHOLD, with the same encode_kwargs. Without
+    pyvips, or for formats libvips cannot write, Pillow is always used.
+    """
     # Load image from data
     if isinstance(data, str):
         if os.path.exists(data):
@@ -1125,42 +1174,109 @@ def _convert_image_format(data, from_fmt, to_fmt):
                 data = f.read()
         else:
             try:
-                data = base64.b64decode(data)
+                data = _dec_b64(data)
             except:
                 raise ValidationError("Invalid image data")
     
     try:
-        image = Image.open(io.BytesIO(data))
-        output = io.BytesIO()
+        if PYVIPS_AVAILABLE and to_fmt in _VIPS_SUFFIX and (
+                backend == 'vips' or (backend is None and len(data) > _VIPS_THRESHOLD)):
+            return _convert_via_vips(data, to_fmt, **encode_kwargs)
         
-        # Handle JPEG format specifically (requires RGB mode)
-        if to_fmt.lower() == 'jpeg':
-            if image.mode in ('RGBA', 'LA', 'P'):
-                if image.mode == 'P':
-                    image = image.convert('RGBA')
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                if image.mode == 'RGBA' or image.mode == 'LA':
-                    background.paste(image, mask=image.split()[-1])
-                else:
-                    background.paste(image)
-                image = background
-            elif image.mode != 'RGB':
-                image = image.convert('RGB')
+        image = _decode_jpeg(data)
+        if image is None:
+            image = Image.open(io.BytesIO(data))
+        if prepare is not None:
+            image = prepare(image)
         
-        image.save(output, format=to_fmt.upper())
-        return output.getvalue()
+        return encode(image)
     except Exception as e:
-        raise ConversionError(f"Failed to convert {{from_fmt.upper()}} to {{to_fmt.upper()}}: {{str(e)}}")
-
-# Add all image format to image format conversions dynamically
-image_formats = ["jpeg", "png", "gif", "bmp", "tiff", "webp", "ico"]
-for from_fmt in image_formats:
-    for to_fmt in image_formats:
-        if from_fmt != to_fmt:  # Skip same format conversions
-            exec(f"""
-@register_converter('{from_fmt}', '{to_fmt}')
-class {from_fmt.capitalize()}To{to_fmt.capitalize()}DynamicConverter(ImageConverter):
-    '''Convert {from_fmt.upper()} to {to_fmt.upper()} image format.'''
-    def _convert(self, data, **options):
-        return _convert_image_format(data, '{from_fmt}', '{to_fmt}')
-""", globals())
\ No newline at end of file
+        raise ConversionError(f"Failed to convert {_FMT_UPPER[from_fmt]} to {_FMT_UPPER[to_fmt]}: {str(e)}")
+
+
+def _make_converter(src: str, dst: str, description: str,
+                    prepare: Optional[Callable[[Image.Image], Image.Image]] = None,
+                    **encode_kwargs) -> type:
+    """
+    Build and register the ImageConverter that re-encodes src images as dst.
+    
+    The class's _fast_encode is dst's encoder from _make_encoder, with
+    encode_kwargs resolved once and dst's _FMT_HANDLERS mode step. The
+    generated _convert decodes the image, applies prepare (if given),
+    encodes it and returns the bytes.
+    """
+    def _convert(self, data: Union[str, bytes], **options) -> bytes:
+        return _convert_image_format(data, src, dst, self._fast_encode, prepare,
+                                     options.get('backend'), **encode_kwargs)
+    
+    _convert.__doc__ = f"Convert {_FMT_LABELS[src]} to {_FMT_LABELS[dst]} and return the image bytes."
+    name = f"{src.capitalize()}To{dst.capitalize()}Converter"
+    _convert.__qualname__ = f"{name}._convert"
+    cls = type(name, (ImageConverter,), {
+        '__doc__': description,
+        '__module__': __name__,
+        '_convert': _convert,
+        '_fast_encode': staticmethod(
+            _make_encoder(dst, _FMT_HANDLERS.get(dst, _identity), **encode_kwargs)),
+    })
+    return register_converter(src, dst)(cls)
+
+
+_FMT_LABELS = {'jpeg': 'JPEG', 'png': 'PNG', 'gif': 'GIF', 'bmp': 'BMP',
+               'tiff': 'TIFF', 'webp': 'WebP', 'ico': 'ICO'}
+
+_JPEG_Q85 = {'quality': 85, 'subsampling': 2}
+_WEBP_Q80 = {'quality': 80, 'method': 6}
+_TIFF_LZW = {'compression': 'tiff_lzw'}
+_ICO_PYRAMID = {'sizes': _ICO_SIZES}
+
+# (source, target) -> (class docstring, prepare, encode options). Pairs not
+# listed get a generic docstring, no prepare step and the target's defaults.
+_IMAGE_CONVERSIONS = {
+    # JPEG
+    ('jpeg', 'png'): ("Convert JPEG images to PNG format (adds transparency support).", _to_rgba, {}),
+    ('png', 'jpeg'): ("Convert PNG images to JPEG format (removes transparency).", None, _JPEG_Q85),
+    ('jpeg', 'webp'): ("Convert JPEG to WebP format (better compression).", None, _WEBP_Q80),
+    ('webp', 'jpeg'): ("Convert WebP to JPEG format.", None, _JPEG_Q85),
+    # PNG
+    ('png', 'gif'): ("Convert PNG to GIF format (adds palette mode).", None, {}),
+    ('gif', 'png'): ("Convert GIF to PNG format (preserves transparency).", _palette_to_rgba, {}),
+    # BMP
+    ('bmp', 'png'): ("Convert BMP to PNG format.", None, {}),
+    ('png', 'bmp'): ("Convert PNG to BMP format.", None, {}),
+    ('bmp', 'jpeg'): ("Convert BMP to JPEG format.", None, _JPEG_Q85),
+    ('jpeg', 'bmp'): ("Convert JPEG to BMP format.", None, {}),
+    # TIFF
+    ('tiff', 'png'): ("Convert TIFF to PNG format.", None, {}),
+    ('png', 'tiff'): ("Convert PNG to TIFF format.", None, _TIFF_LZW),
+    ('tiff', 'jpeg'): ("Convert TIFF to JPEG format.", None, _JPEG_Q85),
+    ('jpeg', 'tiff'): ("Convert JPEG to TIFF format.", None, _TIFF_LZW),
+    # WebP
+    ('webp', 'png'): ("Convert WebP to PNG format.", None, {}),
+    ('png', 'webp'): ("Convert PNG to WebP format.", None, _WEBP_Q80),
+    # ICO
+    ('ico', 'png'): ("Convert ICO (icon) to PNG format.", None, {}),
+    ('png', 'ico'): ("Convert PNG to ICO format.", _fit_icon, _ICO_PYRAMID),
+    ('jpeg', 'ico'): ("Convert JPEG to ICO format.", _fit_icon, _ICO_PYRAMID),
+    ('gif', 'ico'): ("Convert GIF to ICO format.", _fit_icon, _ICO_PYRAMID),
+    ('bmp', 'ico'): ("Convert BMP to ICO format.", _fit_icon, _ICO_PYRAMID),
+    ('tiff', 'ico'): ("Convert TIFF to ICO format.", _fit_icon, _ICO_PYRAMID),
+    ('webp', 'ico'): ("Convert WebP to ICO format.", _fit_icon, _ICO_PYRAMID),
+    # Additional and cross-format converters
+    ('gif', 'jpeg'): ("Convert GIF to JPEG format (first frame only).", _first_frame, _JPEG_Q85),
+    ('jpeg', 'gif'): ("Convert JPEG to GIF format.", None, {}),
+    ('bmp', 'gif'): ("Convert BMP to GIF format.", None, {}),
+    ('gif', 'bmp'): ("Convert GIF to BMP format.", None, {}),
+    ('webp', 'gif'): ("Convert WebP to GIF format.", None, {}),
+    ('gif', 'webp'): ("Convert GIF to WebP format.", None, _WEBP_Q80),
+}
+
+# Register one converter for every ordered pair of distinct image formats
+for _src in IMAGE_FORMATS:
+    for _dst in IMAGE_FORMATS:
+        if _src != _dst:
+            _doc, _prepare, _kwargs = _IMAGE_CONVERSIONS.get((_src, _dst), (
+                f"Convert {_FMT_LABELS[_src]} to {_FMT_LABELS[_dst]} image format.", None, {}))
+            _cls = _make_converter(_src, _dst, _doc, _prepare, **_kwargs)
+            globals()[_cls.__name__] = _cls
+del _src, _dst, _doc, _prepare, _kwargs, _cls
\ No newline at end of file
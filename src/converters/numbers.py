@@ -17,6 +17,7 @@ Learning Concepts:
 """
 
 from typing import Union, Any
+import functools
 import logging
 
 from .base_converter import ReversibleConverter, BaseConverter
@@ -26,6 +27,130 @@ from ..utils.exceptions import ConversionError, ValidationError
 logger = logging.getLogger(__name__)
 
 
+def _to_int_base10(value: Union[int, str]) -> int:
+    """Parse a decimal number, giving int() the base explicitly for strings."""
+    if type(value) is int:
+        return value  # Already an int (bools still go through int())
+    return int(value, 10) if isinstance(value, str) else int(value)
+
+
+def _clean_binary(data: str) -> tuple:
+    """Split a binary string into (negative, digits), dropping '-' and '0b'."""
+    cleaned = data.strip()
+    negative = cleaned.startswith('-')
+    if negative:
+        cleaned = cleaned[1:]
+    if cleaned.startswith('0b'):
+        cleaned = cleaned[2:]
+    # Anything left after stripping 0/1 is invalid
+    if cleaned.strip('01'):
+        raise ValidationError(f"Invalid binary string: {data}")
+    return negative, cleaned
+
+
+def _clean_hex(data: str) -> tuple:
+    """Split a hex string into (negative, digits), dropping '-' and '0x'."""
+    cleaned = data.strip()
+    negative = cleaned.startswith('-')
+    if negative:
+        cleaned = cleaned[1:]
+    if cleaned[:2].lower() == '0x':
+        cleaned = cleaned[2:]
+    return negative, cleaned
+
+
+# Strings up to this length have their parsed value memoized; longer ones are
+# parsed directly so the caches never pin huge inputs. Formatting is left
+# uncached: hex()/bin()/oct() cost less than the cache lookup around them.
+_CACHE_MAX_LEN = 256
+_CACHES = []
+
+
+def _memoize_small(func):
+    """LRU-cache a pure string parser for short inputs."""
+    cached = functools.lru_cache(maxsize=4096)(func)
+    _CACHES.append(cached)
+    
+    @functools.wraps(func)
+    def wrapper(data: str):
+        if len(data) <= _CACHE_MAX_LEN:
+            return cached(data)
+        return func(data)
+    
+    return wrapper
+
+
+def reset_caches() -> None:
+    """Clear the memoized number parsers."""
+    for cached in _CACHES:
+        cached.cache_clear()
+
+
+@_memoize_small
+def _parse_binary(data: str) -> int:
+    """Parse a (possibly signed, '0b'-prefixed) binary string."""
+    negative, digits = _clean_binary(data)
+    result = int(digits, 2)
+    return -result if negative else result
+
+
+@_memoize_small
+def _parse_hex(data: str) -> int:
+    """Parse a (possibly signed, '0x'-prefixed) hexadecimal string."""
+    negative, digits = _clean_hex(data)
+    result = int(digits, 16)
+    return -result if negative else result
+
+
+@_memoize_small
+def _parse_octal(data: str) -> int:
+    """Parse a (possibly signed, '0o'-prefixed) octal string."""
+    cleaned = data.strip()
+    negative = cleaned.startswith('-')
+    if negative:
+        cleaned = cleaned[1:]
+    if cleaned[:2].lower() == '0o':
+        cleaned = cleaned[2:]
+    result = int(cleaned, 8)
+    return -result if negative else result
+
+
+def _format_binary(num: int, include_prefix: bool, min_width: int) -> str:
+    """Format num in binary; negative numbers keep bin()'s layout and ignore min_width."""
+    if num < 0:
+        binary_str = bin(num)  # This gives '-0b...'
+        return binary_str if include_prefix else binary_str.replace('-0b', '-')
+    
+    binary_str = bin(num)[2:]  # Remove '0b' prefix
+    if min_width > 0:
+        binary_str = binary_str.zfill(min_width)
+    return '0b' + binary_str if include_prefix else binary_str
+
+
+def _format_hex(num: int, include_prefix: bool, uppercase: bool, min_width: int) -> str:
+    """Format num in hexadecimal, with the sign ahead of any '0x' prefix."""
+    hex_str = hex(num)
+    hex_digits = hex_str[2:] if num >= 0 else hex_str[3:]  # Remove '0x' / '-0x'
+    if uppercase:
+        hex_digits = hex_digits.upper()
+    if min_width > 0:
+        hex_digits = hex_digits.zfill(min_width)
+    
+    result = '0x' + hex_digits if include_prefix else hex_digits
+    return '-' + result if num < 0 else result
+
+
+def _format_octal(num: int, include_prefix: bool, min_width: int) -> str:
+    """Format num in octal, with the sign ahead of any '0o' prefix."""
+    octal_str = oct(num)
+    octal_digits = octal_str[2:] if num >= 0 else octal_str[3:]  # Remove '0o' / '-0o'
+    if min_width > 0:
+        octal_digits = octal_digits.zfill(min_width)
+    
+    result = '0o' + octal_digits if include_prefix else octal_digits
+    return '-' + result if num < 0 else result
+
+
 @register_converter('decimal', 'binary_num', 'Convert decimal number to binary representation', reversible=True)
 class DecimalBinaryConverter(ReversibleConverter):
     """
@@ -47,7 +172,7 @@ class DecimalBinaryConverter(ReversibleConverter):
             if not isinstance(data, (int, str)):
                 raise ValidationError(f"Decimal input requires int or string, got {type(data).__name__}")
             try:
-                int(data)
+                _to_int_base10(data)
             except ValueError:
                 raise ValidationError(f"Invalid decimal number: {data}")
         elif self.from_format == 'binary_num':
@@ -57,30 +182,12 @@ class DecimalBinaryConverter(ReversibleConverter):
     def _convert_a_to_b(self, data: Union[int, str], **options) -> str:
         """Convert decimal to binary."""
         try:
-            # Options
-            include_prefix = options.get('include_prefix', False)  # Whether to include '0b'
-            min_width = options.get('min_width', 0)  # Minimum width with zero padding
+            return _format_binary(
+                _to_int_base10(data),
+                options.get('include_prefix', False),  # Whether to include '0b'
+                options.get('min_width', 0),  # Minimum width with zero padding
+            )
             
-            num = int(data)
-            if num < 0:
-                # Handle negative numbers
-                binary_str = bin(num)  # This gives '-0b...'
-                if include_prefix:
-                    return binary_str
-                else:
-                    return binary_str.replace('-0b', '-')
-            else:
-                binary_str = bin(num)[2:]  # Remove '0b' prefix
-                
-                # Apply zero padding if requested
-                if min_width > 0:
-                    binary_str = binary_str.zfill(min_width)
-                
-                if include_prefix:
-                    return '0b' + binary_str
-                else:
-                    return binary_str
-                    
         except ValueError as e:
             raise ConversionError(f"Invalid decimal number: {e}", original_error=e)
         except Exception as e:
@@ -89,25 +196,7 @@ class DecimalBinaryConverter(ReversibleConverter):
     def _convert_b_to_a(self, data: str, **options) -> int:
         """Convert binary to decimal."""
         try:
-            # Clean the binary string
-            cleaned = data.strip()
-            
-            # Handle negative numbers
-            negative = False
-            if cleaned.startswith('-'):
-                negative = True
-                cleaned = cleaned[1:]
-            
-            # Remove common prefixes
-            if cleaned.startswith('0b'):
-                cleaned = cleaned[2:]
-            
-            # Validate binary string
-            if not all(c in '01' for c in cleaned):
-                raise ValidationError(f"Invalid binary string: {data}")
-            
-            result = int(cleaned, 2)
-            return -result if negative else result
+            return _parse_binary(data)
             
         except ValueError as e:
             raise ConversionError(f"Invalid binary string: {e}", original_error=e)
@@ -125,33 +214,12 @@ class DecimalHexConverter(ReversibleConverter):
     def _convert_a_to_b(self, data: Union[int, str], **options) -> str:
         """Convert decimal to hexadecimal."""
         try:
-            # Options
-            include_prefix = options.get('include_prefix', False)  # '0x'
-            uppercase = options.get('uppercase', False)
-            min_width = options.get('min_width', 0)
-            
-            num = int(data)
-            hex_str = hex(num)
-            
-            if num >= 0:
-                hex_digits = hex_str[2:]  # Remove '0x'
-            else:
-                hex_digits = hex_str[3:]  # Remove '-0x', we'll handle sign separately
-            
-            if uppercase:
-                hex_digits = hex_digits.upper()
-            
-            if min_width > 0:
-                hex_digits = hex_digits.zfill(min_width)
-            
-            # Reconstruct with options
-            result = hex_digits
-            if include_prefix:
-                result = '0x' + result
-            if num < 0:
-                result = '-' + result
-                
-            return result
+            return _format_hex(
+                _to_int_base10(data),
+                options.get('include_prefix', False),  # '0x'
+                options.get('uppercase', False),
+                options.get('min_width', 0),
+            )
             
         except ValueError as e:
             raise ConversionError(f"Invalid decimal number: {e}", original_error=e)
@@ -161,21 +229,7 @@ class DecimalHexConverter(ReversibleConverter):
     def _convert_b_to_a(self, data: str, **options) -> int:
         """Convert hexadecimal to decimal."""
         try:
-            # Clean the hex string
-            cleaned = data.strip()
-            
-            # Handle negative numbers
-            negative = False
-            if cleaned.startswith('-'):
-                negative = True
-                cleaned = cleaned[1:]
-            
-            # Remove common prefixes
-            if cleaned.lower().startswith('0x'):
-                cleaned = cleaned[2:]
-            
-            result = int(cleaned, 16)
-            return -result if negative else result
+            return _parse_hex(data)
             
         except ValueError as e:
             raise ConversionError(f"Invalid hexadecimal string: {e}", original_error=e)
@@ -193,27 +247,11 @@ class DecimalOctalConverter(ReversibleConverter):
     def _convert_a_to_b(self, data: Union[int, str], **options) -> str:
         """Convert decimal to octal."""
         try:
-            include_prefix = options.get('include_prefix', False)  # '0o'
-            min_width = options.get('min_width', 0)
-            
-            num = int(data)
-            octal_str = oct(num)
-            
-            if num >= 0:
-                octal_digits = octal_str[2:]  # Remove '0o'
-            else:
-                octal_digits = octal_str[3:]  # Remove '-0o'
-            
-            if min_width > 0:
-                octal_digits = octal_digits.zfill(min_width)
-            
-            result = octal_digits
-            if include_prefix:
-                result = '0o' + result
-            if num < 0:
-                result = '-' + result
-                
-            return result
+            return _format_octal(
+                _to_int_base10(data),
+                options.get('include_prefix', False),  # '0o'
+                options.get('min_width', 0),
+            )
             
         except ValueError as e:
             raise ConversionError(f"Invalid decimal number: {e}", original_error=e)
@@ -223,18 +261,7 @@ class DecimalOctalConverter(ReversibleConverter):
     def _convert_b_to_a(self, data: str, **options) -> int:
         """Convert octal to decimal."""
         try:
-            cleaned = data.strip()
-            
-            negative = False
-            if cleaned.startswith('-'):
-                negative = True
-                cleaned = cleaned[1:]
-            
-            if cleaned.lower().startswith('0o'):
-                cleaned = cleaned[2:]
-            
-            result = int(cleaned, 8)
-            return -result if negative else result
+            return _parse_octal(data)
             
         except ValueError as e:
             raise ConversionError(f"Invalid octal string: {e}", original_error=e)
@@ -242,6 +269,30 @@ class DecimalOctalConverter(ReversibleConverter):
             raise ConversionError(f"Failed to convert octal to decimal: {e}", original_error=e)
 
 
+# Roman numeral digits for each place value, indexed by the decimal digit
+_ROMAN_THOUSANDS = ('', 'M', 'MM', 'MMM')
+_ROMAN_HUNDREDS = ('', 'C', 'CC', 'CCC', 'CD', 'D', 'DC', 'DCC', 'DCCC', 'CM')
+_ROMAN_TENS = ('', 'X', 'XX', 'XXX', 'XL', 'L', 'LX', 'LXX', 'LXXX', 'XC')
+_ROMAN_UNITS = ('', 'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX')
+
+
+def _build_roman(num: int) -> str:
+    """Build the Roman numeral for num (0-3999) one place value at a time."""
+    return (_ROMAN_THOUSANDS[num // 1000] + _ROMAN_HUNDREDS[num // 100 % 10]
+            + _ROMAN_TENS[num // 10 % 10] + _ROMAN_UNITS[num % 10])
+
+
+# Every numeral in the supported range, indexed by value (index 0 is unused),
+# and the reverse lookup for canonical numerals
+_ROMAN_TABLE = tuple(_build_roman(i) for i in range(4000))
+_ROMAN_REVERSE = {numeral: i for i, numeral in enumerate(_ROMAN_TABLE) if i}
+
+# Roman numeral values, and a translation table that deletes every valid
+# numeral character (anything left over is invalid)
+_ROMAN_DIGITS = {'I': 1, 'V': 5, 'X': 10, 'L': 50, 'C': 100, 'D': 500, 'M': 1000}
+_ROMAN_TRANS = str.maketrans('', '', 'IVXLCDM')
+
+
 @register_converter('decimal', 'roman', 'Convert decimal to Roman numerals', reversible=True)
 class DecimalRomanConverter(ReversibleConverter):
     """
@@ -256,23 +307,12 @@ class DecimalRomanConverter(ReversibleConverter):
     def _convert_a_to_b(self, data: Union[int, str], **options) -> str:
         """Convert decimal to Roman numerals."""
         try:
-            num = int(data)
+            num = _to_int_base10(data)
             
             if num <= 0 or num > 3999:
                 raise ValidationError(f"Roman numerals only support numbers 1-3999, got {num}")
             
-            # Roman numeral conversion table
-            values = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
-            symbols = ["M", "CM", "D", "CD", "C", "XC", "L", "XL", "X", "IX", "V", "IV", "I"]
-            
-            result = ""
-            for i, value in enumerate(values):
-                count = num // value
-                if count:
-                    result += symbols[i] * count
-                    num -= value * count
-            
-            return result
+            return _ROMAN_TABLE[num]
             
         except ValueError as e:
             raise ConversionError(f"Invalid decimal number: {e}", original_error=e)
@@ -284,15 +324,13 @@ class DecimalRomanConverter(ReversibleConverter):
         try:
             roman = data.upper().strip()
             
-            # Roman numeral values
-            roman_values = {
-                'I': 1, 'V': 5, 'X': 10, 'L': 50,
-                'C': 100, 'D': 500, 'M': 1000
-            }
+            # Canonical numerals are a single dict hit
+            total = _ROMAN_REVERSE.get(roman)
+            if total is not None:
+                return total
             
             # Validate Roman numeral string
-            valid_chars = set(roman_values.keys())
-            if not all(c in valid_chars for c in roman):
+            if roman.translate(_ROMAN_TRANS):
                 raise ValidationError(f"Invalid Roman numeral characters in: {data}")
             
             total = 0
@@ -300,7 +338,7 @@ class DecimalRomanConverter(ReversibleConverter):
             
             # Process from right to left
             for char in reversed(roman):
-                value = roman_values[char]
+                value = _ROMAN_DIGITS[char]
                 
                 if value < prev_value:
                     # Subtractive notation (like IV, IX, XL, etc.)
@@ -327,29 +365,26 @@ class BinaryHexConverter(ReversibleConverter):
         super().__init__('binary_num', 'hex_num', 'Convert binary to/from hexadecimal')
     
     def _convert_a_to_b(self, data: str, **options) -> str:
-        """Convert binary to hex via decimal."""
+        """Convert binary to hex with a single base-2 parse."""
         try:
-            # First convert binary to decimal
-            decimal_converter = DecimalBinaryConverter('binary_num', 'decimal')
-            decimal_value = decimal_converter._convert_b_to_a(data)
-            
-            # Then convert decimal to hex
-            hex_converter = DecimalHexConverter('decimal', 'hex_num')
-            return hex_converter._convert_a_to_b(decimal_value, **options)
+            return _format_hex(
+                _parse_binary(data),
+                options.get('include_prefix', False),
+                options.get('uppercase', False),
+                options.get('min_width', 0),
+            )
             
         except Exception as e:
             raise ConversionError(f"Failed to convert binary to hex: {e}", original_error=e)
     
     def _convert_b_to_a(self, data: str, **options) -> str:
-        """Convert hex to binary via decimal."""
+        """Convert hex to binary with a single base-16 parse."""
         try:
-            # First convert hex to decimal
-            hex_converter = DecimalHexConverter('hex_num', 'decimal')
-            decimal_value = hex_converter._convert_b_to_a(data)
-            
-            # Then convert decimal to binary
-            binary_converter = DecimalBinaryConverter('decimal', 'binary_num')
-            return binary_converter._convert_a_to_b(decimal_value, **options)
+            return _format_binary(
+                _parse_hex(data),
+                options.get('include_prefix', False),
+                options.get('min_width', 0),
+            )
             
         except Exception as e:
             raise ConversionError(f"Failed to convert hex to binary: {e}", original_error=e)
\ No newline at end of file
@@ -49,8 +49,20 @@ class ConversionRegistry:
         self._converters: Dict[Tuple[str, str], Type[BaseConverter]] = {}
         
         # Format graph for path finding: {from_format: {to_format, ...}}
+        # Once frozen, the sets become sorted tuples: {from_format: (to_format, ...)}
         self._format_graph: Dict[str, Set[str]] = defaultdict(set)
         
+        # Reverse adjacency, built by freeze(): {to_format: (from_format, ...)}
+        self._in_edges: Dict[str, Tuple[str, ...]] = {}
+        self._frozen = False
+        
+        # Rows built by list_conversions(), dropped whenever a converter is registered
+        self._conversions_cache: Optional[Tuple[Dict[str, Any], ...]] = None
+        
+        # Shared converter instances handed out by get_converter(); converters
+        # hold no per-call state, so one per format pair is enough
+        self._instances: Dict[Tuple[str, str], BaseConverter] = {}
+        
         # Reverse lookup: {format: [converters_involving_format]}
         self._format_converters: Dict[str, List[Type[BaseConverter]]] = defaultdict(list)
         
@@ -109,6 +121,12 @@ class ConversionRegistry:
                 f"Converter {converter_class.__name__} must inherit from BaseConverter"
             )
         
+        # New edges invalidate the frozen adjacency lists and cached listing
+        if self._frozen:
+            self._thaw()
+        self._conversions_cache = None
+        self._instances.clear()
+        
         # Register the converter
         self._converters[conversion_pair] = converter_class
         self._format_graph[from_format].add(to_format)
@@ -130,6 +148,41 @@ class ConversionRegistry:
             
             logger.info(f"Auto-registered reverse: {to_format} -> {from_format} ({converter_class.__name__})")
     
+    def freeze(self) -> None:
+        """
+        Freeze the format graph into read-only adjacency tuples.
+        
+        Call this once all converters have been registered. The outgoing edge
+        sets are turned into sorted tuples and the incoming edges are built in
+        the same pass, so get_conversions_for_format() becomes a plain lookup
+        instead of a scan over every registered pair. Registering another
+        converter afterwards thaws the registry again.
+        """
+        if self._frozen:
+            return
+        
+        in_edges: Dict[str, List[str]] = defaultdict(list)
+        frozen_graph: Dict[str, Tuple[str, ...]] = {}
+        for from_fmt in sorted(self._format_graph):
+            targets = tuple(sorted(self._format_graph[from_fmt]))
+            frozen_graph[from_fmt] = targets
+            for to_fmt in targets:
+                in_edges[to_fmt].append(from_fmt)
+        
+        self._format_graph = frozen_graph
+        self._in_edges = {fmt: tuple(sources) for fmt, sources in in_edges.items()}
+        self._frozen = True
+        logger.debug(f"Froze format graph with {len(frozen_graph)} source formats")
+    
+    def _thaw(self) -> None:
+        """Turn the frozen adjacency tuples back into mutable sets."""
+        graph: Dict[str, Set[str]] = defaultdict(set)
+        for from_fmt, targets in self._format_graph.items():
+            graph[from_fmt].update(targets)
+        self._format_graph = graph
+        self._in_edges = {}
+        self._frozen = False
+    
     def get_converter(self, from_format: str, to_format: str) -> BaseConverter:
         """
         Get a converter instance for the specified format pair.
@@ -154,9 +207,13 @@ class ConversionRegistry:
         
         # Check for direct converter
         conversion_pair = (from_format, to_format)
+        converter = self._instances.get(conversion_pair)
+        if converter is not None:
+            return converter
         if conversion_pair in self._converters:
             converter_class = self._converters[conversion_pair]
-            return converter_class(from_format, to_format)
+            converter = self._instances[conversion_pair] = converter_class(from_format, to_format)
+            return converter
         
         # TODO: In future versions, implement multi-step conversion path finding
         # For now, only support direct conversions
@@ -233,21 +290,25 @@ class ConversionRegistry:
                 ...
             ]
         """
-        conversions = []
-        for (from_fmt, to_fmt), converter_class in self._converters.items():
-            # Create a temporary instance to get description
-            temp_instance = converter_class(from_fmt, to_fmt)
-            conversions.append({
-                'from': from_fmt,
-                'to': to_fmt,
-                'description': temp_instance.description,
-                'converter': converter_class.__name__,
-                'reversible': issubclass(converter_class, ReversibleConverter)
-            })
-        
-        # Sort by from_format, then to_format
-        conversions.sort(key=lambda x: (x['from'], x['to']))
-        return conversions
+        if self._conversions_cache is None:
+            conversions = []
+            for (from_fmt, to_fmt), converter_class in self._converters.items():
+                # Create a temporary instance to get description
+                temp_instance = converter_class(from_fmt, to_fmt)
+                conversions.append({
+                    'from': from_fmt,
+                    'to': to_fmt,
+                    'description': temp_instance.description,
+                    'converter': converter_class.__name__,
+                    'reversible': issubclass(converter_class, ReversibleConverter)
+                })
+            
+            # Sort by from_format, then to_format
+            conversions.sort(key=lambda x: (x['from'], x['to']))
+            self._conversions_cache = tuple(conversions)
+        
+        # Copy the rows so callers can't modify the cached listing
+        return [dict(conv) for conv in self._conversions_cache]
     
     def get_conversions_for_format(self, format_name: str) -> Dict[str, List[str]]:
         """
@@ -264,24 +325,22 @@ class ConversionRegistry:
             {'from': ['base64', 'hex'], 'to': ['base64', 'hex']}
         """
         format_name = format_name.lower().strip()
-        from_conversions = []  # Formats that can convert TO this format
-        to_conversions = []    # Formats that this format can convert TO
-        
-        for (from_fmt, to_fmt) in self._converters.keys():
-            if from_fmt == format_name:
-                to_conversions.append(to_fmt)
-            if to_fmt == format_name:
-                from_conversions.append(from_fmt)
+        if not self._frozen:
+            self.freeze()
         
         return {
-            'from': sorted(set(from_conversions)),
-            'to': sorted(set(to_conversions))
+            'from': list(self._in_edges.get(format_name, ())),  # Formats that can convert TO this format
+            'to': list(self._format_graph.get(format_name, ()))  # Formats that this format can convert TO
         }
     
     def clear(self) -> None:
         """Clear all registered converters."""
         self._converters.clear()
-        self._format_graph.clear()
+        self._format_graph = defaultdict(set)
+        self._in_edges = {}
+        self._frozen = False
+        self._conversions_cache = None
+        self._instances.clear()
         self._format_converters.clear()
         self._registered_count = 0
         logger.info("Cleared all converters from registry")
@@ -2,18 +2,22 @@
 
 import base64
 import binascii
+import codecs
 import urllib.parse
 import html
 import hashlib
+import functools
+import sys
 import zlib
 import json
 import csv
 import io
-from typing import Union, Any
+from typing import Union, Any, List, Sequence
 import logging
 
 from .base_converter import BaseConverter
 from .registry import register_converter
+from ..utils.cleaning import clean_hex, strip_whitespace
 from ..utils.exceptions import ConversionError, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -39,7 +43,7 @@ class HexToBinary01Converter(BaseConverter):
             raise ValidationError(f"Hex input requires string, got {type(data).__name__}")
     def _convert(self, data: str, **options) -> str:
         try:
-            cleaned_data = data.replace('0x', '').replace(':', '').replace('-', '').replace(' ', '')
+            cleaned_data = clean_hex(data)
             b = bytes.fromhex(cleaned_data)
             return ''.join(f'{byte:08b}' for byte in b)
         except Exception as e:
@@ -55,8 +59,8 @@ class BinaryToBase64Converter(BaseConverter):
     def validate_input(self, data: Any) -> None:
         super().validate_input(data)
         if isinstance(data, str):
-            # Validate binary string format (only 0s and 1s)
-            if not all(c in '01' for c in data.replace(' ', '')):
+            # Validate binary string format (only 0s, 1s and spaces; strip scans in C)
+            if data.strip('01 '):
                 raise ValidationError(f"Binary string must contain only 0s and 1s")
         elif not isinstance(data, bytes):
             raise ValidationError(f"Binary input requires bytes or binary string, got {type(data).__name__}")
@@ -70,8 +74,8 @@ class BinaryToBase64Converter(BaseConverter):
                     # Pad with zeros to make it a multiple of 8
                     binary_str = binary_str.zfill((len(binary_str) + 7) // 8 * 8)
                 
-                # Convert binary string to bytes
-                byte_data = bytes(int(binary_str[i:i+8], 2) for i in range(0, len(binary_str), 8))
+                # Convert binary string to bytes (one big-int parse in C)
+                byte_data = int(binary_str, 2).to_bytes(len(binary_str) // 8, 'big') if binary_str else b''
                 return base64.b64encode(byte_data).decode('ascii')
             else:
                 # Already bytes
@@ -94,7 +98,7 @@ class Base64ToBinaryConverter(BaseConverter):
     
     def _convert(self, data: str, **options) -> bytes:
         try:
-            cleaned_data = ''.join(data.split())
+            cleaned_data = strip_whitespace(data)
             return base64.b64decode(cleaned_data)
         except Exception as e:
             raise ConversionError(f"Failed to decode base64: {e}", original_error=e)
@@ -110,8 +114,8 @@ class BinaryToHexConverter(BaseConverter):
     def validate_input(self, data: Any) -> None:
         super().validate_input(data)
         if isinstance(data, str):
-            # Validate binary string format (only 0s and 1s)
-            if not all(c in '01' for c in data.replace(' ', '')):
+            # Validate binary string format (only 0s, 1s and spaces; strip scans in C)
+            if data.strip('01 '):
                 raise ValidationError(f"Binary string must contain only 0s and 1s")
         elif not isinstance(data, bytes):
             raise ValidationError(f"Binary input requires bytes or binary string, got {type(data).__name__}")
@@ -128,8 +132,8 @@ class BinaryToHexConverter(BaseConverter):
                     # Pad with zeros to make it a multiple of 8
                     binary_str = binary_str.zfill((len(binary_str) + 7) // 8 * 8)
                 
-                # Convert binary string to bytes
-                byte_data = bytes(int(binary_str[i:i+8], 2) for i in range(0, len(binary_str), 8))
+                # Convert binary string to bytes (one big-int parse in C)
+                byte_data = int(binary_str, 2).to_bytes(len(binary_str) // 8, 'big') if binary_str else b''
                 hex_str = byte_data.hex()
             else:
                 hex_str = data.hex()
@@ -159,7 +163,7 @@ class HexToBinaryConverter(BaseConverter):
     
     def _convert(self, data: str, **options) -> bytes:
         try:
-            cleaned_data = data.replace('0x', '').replace(':', '').replace('-', '').replace(' ', '')
+            cleaned_data = clean_hex(data)
             return bytes.fromhex(cleaned_data)
         except Exception as e:
             raise ConversionError(f"Failed to decode hex: {e}", original_error=e)
@@ -249,6 +253,44 @@ class HtmlToTextConverter(BaseConverter):
 # HASH CONVERTERS
 # ============================================================================
 
+# These digests are checksums, not security primitives (needs Python 3.9+)
+_HASH_KWARGS = {'usedforsecurity': False} if sys.version_info >= (3, 9) else {}
+
+# Texts up to this length have their digests memoized; longer ones are hashed directly
+_DIGEST_CACHE_MAX_LEN = 1024
+
+# Texts longer than this are encoded and hashed in chunks of this many characters
+_HASH_CHUNK = 65536
+
+
+def _text_digest(hasher, data: str, encoding: str) -> str:
+    """Hex digest of data encoded with encoding (utf-8 skips the codec lookup)."""
+    data_bytes = data.encode() if encoding == 'utf-8' else data.encode(encoding)
+    return hasher(data_bytes, **_HASH_KWARGS).hexdigest()
+
+
+_cached_text_digest = functools.lru_cache(maxsize=1024)(_text_digest)
+
+
+def _stream_text_digest(hasher, data: str, encoding: str) -> str:
+    """Hex digest of data, encoding it chunk by chunk so no full copy is held."""
+    encoder = codecs.getincrementalencoder(encoding)()
+    digest = hasher(**_HASH_KWARGS)
+    for start in range(0, len(data), _HASH_CHUNK):
+        end = start + _HASH_CHUNK
+        digest.update(encoder.encode(data[start:end], final=end >= len(data)))
+    return digest.hexdigest()
+
+
+def _hash_text(hasher, data: str, encoding: str) -> str:
+    """Hash text, serving repeated short inputs from the digest cache."""
+    if len(data) <= _DIGEST_CACHE_MAX_LEN:
+        return _cached_text_digest(hasher, data, encoding)
+    if len(data) <= _HASH_CHUNK:
+        return _text_digest(hasher, data, encoding)
+    return _stream_text_digest(hasher, data, encoding)
+
+
 @register_converter('text', 'md5', 'Generate MD5 hash from text')
 class TextToMD5Converter(BaseConverter):
     """Generate MD5 hash from text."""
@@ -263,9 +305,7 @@ class TextToMD5Converter(BaseConverter):
     
     def _convert(self, data: str, **options) -> str:
         try:
-            encoding = options.get('encoding', 'utf-8')
-            data_bytes = data.encode(encoding)
-            return hashlib.md5(data_bytes).hexdigest()
+            return _hash_text(hashlib.md5, data, options.get('encoding', 'utf-8'))
         except Exception as e:
             raise ConversionError(f"Failed to generate MD5: {e}", original_error=e)
 
@@ -284,9 +324,7 @@ class TextToSHA256Converter(BaseConverter):
     
     def _convert(self, data: str, **options) -> str:
         try:
-            encoding = options.get('encoding', 'utf-8')
-            data_bytes = data.encode(encoding)
-            return hashlib.sha256(data_bytes).hexdigest()
+            return _hash_text(hashlib.sha256, data, options.get('encoding', 'utf-8'))
         except Exception as e:
             raise ConversionError(f"Failed to generate SHA256: {e}", original_error=e)
 
@@ -341,6 +379,20 @@ class DictToJsonConverter(BaseConverter):
 # NUMBER BASE CONVERTERS
 # ============================================================================
 
+# Inputs converted as a batch (e.g. a pasted column of numbers)
+_BATCH_TYPES = (list, tuple)
+
+
+def _validate_decimals(data: Any) -> None:
+    """Check that data (or every item of a batch) parses as a decimal integer."""
+    values = data if isinstance(data, _BATCH_TYPES) else (data,)
+    for value in values:
+        try:
+            int(value)
+        except (TypeError, ValueError):
+            raise ValidationError(f"Invalid decimal number: {value}")
+
+
 @register_converter('decimal', 'binary', 'Convert decimal number to binary')
 class DecimalToBinaryConverter(BaseConverter):
     """Convert decimal number to binary representation."""
@@ -350,12 +402,11 @@ class DecimalToBinaryConverter(BaseConverter):
     
     def validate_input(self, data: Any) -> None:
         super().validate_input(data)
-        try:
-            int(data)
-        except ValueError:
-            raise ValidationError(f"Invalid decimal number: {data}")
+        _validate_decimals(data)
     
-    def _convert(self, data: Union[int, str], **options) -> str:
+    def _convert(self, data: Union[int, str, Sequence[Union[int, str]]], **options) -> Union[str, List[str]]:
+        if isinstance(data, _BATCH_TYPES):
+            return self._convert_batch(data, **options)
         try:
             num = int(data)
             include_prefix = options.get('include_prefix', False)
@@ -367,6 +418,13 @@ class DecimalToBinaryConverter(BaseConverter):
                 return binary_str[2:] if num >= 0 else binary_str[3:]
         except Exception as e:
             raise ConversionError(f"Failed to convert to binary: {e}", original_error=e)
+    
+    def _convert_batch(self, data: Sequence[Union[int, str]], **options) -> List[str]:
+        """Convert a column of numbers in one comprehension (no per-value convert() overhead)."""
+        if options.get('include_prefix', False):
+            return [bin(int(value)) for value in data]
+        # bin(abs(n))[2:] matches the scalar path, which drops the sign
+        return [bin(abs(int(value)))[2:] for value in data]
 
 
 @register_converter('binary', 'decimal', 'Convert binary to decimal number')
@@ -378,21 +436,33 @@ class BinaryToDecimalConverter(BaseConverter):
     
     def validate_input(self, data: Any) -> None:
         super().validate_input(data)
-        if not isinstance(data, str):
-            raise ValidationError(f"Binary input requires string, got {type(data).__name__}")
-    
-    def _convert(self, data: str, **options) -> int:
+        values = data if isinstance(data, _BATCH_TYPES) else (data,)
+        for value in values:
+            if not isinstance(value, str):
+                raise ValidationError(f"Binary input requires string, got {type(value).__name__}")
+    
+    def _convert(self, data: Union[str, Sequence[str]], **options) -> Union[int, List[int]]:
+        if isinstance(data, _BATCH_TYPES):
+            return self._convert_batch(data)
+        return self._parse_binary(data)
+    
+    def _parse_binary(self, data: str) -> int:
+        """Parse one binary string (with an optional 0b prefix)."""
         try:
             cleaned = data.strip()
             if cleaned.startswith('0b'):
                 cleaned = cleaned[2:]
             
-            if not all(c in '01' for c in cleaned):
+            if cleaned.strip('01'):
                 raise ValidationError(f"Invalid binary string: {data}")
             
             return int(cleaned, 2)
         except Exception as e:
             raise ConversionError(f"Failed to convert binary: {e}", original_error=e)
+    
+    def _convert_batch(self, data: Sequence[str]) -> List[int]:
+        """Parse a column of binary strings; the first invalid one raises as a single value would."""
+        return [self._parse_binary(value) for value in data]
 
 
 @register_converter('decimal', 'hex', 'Convert decimal number to hexadecimal')
@@ -404,12 +474,11 @@ class DecimalToHexConverter(BaseConverter):
     
     def validate_input(self, data: Any) -> None:
         super().validate_input(data)
-        try:
-            int(data)
-        except ValueError:
-            raise ValidationError(f"Invalid decimal number: {data}")
+        _validate_decimals(data)
     
-    def _convert(self, data: Union[int, str], **options) -> str:
+    def _convert(self, data: Union[int, str, Sequence[Union[int, str]]], **options) -> Union[str, List[str]]:
+        if isinstance(data, _BATCH_TYPES):
+            return self._convert_batch(data, **options)
         try:
             num = int(data)
             include_prefix = options.get('include_prefix', False)
@@ -429,4 +498,13 @@ class DecimalToHexConverter(BaseConverter):
             else:
                 return ('-' if num < 0 else '') + hex_digits
         except Exception as e:
-            raise ConversionError(f"Failed to convert to hex: {e}", original_error=e)
\ No newline at end of file
+            raise ConversionError(f"Failed to convert to hex: {e}", original_error=e)
+    
+    def _convert_batch(self, data: Sequence[Union[int, str]], **options) -> List[str]:
+        """Convert a column of numbers in one comprehension (no per-value convert() overhead)."""
+        spec = 'X' if options.get('uppercase', False) else 'x'
+        nums = [int(value) for value in data]
+        if options.get('include_prefix', False):
+            # Built by hand: format(n, '#X') would also uppercase the prefix
+            return [('0x' if num >= 0 else '-0x') + format(abs(num), spec) for num in nums]
+        return [format(num, spec) for num in nums]
\ No newline at end of file
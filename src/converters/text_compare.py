@@ -13,41 +13,200 @@ Learning Concepts:
 """
 
 import difflib
+from bisect import bisect_left
 from typing import Tuple, List, Dict, Any
 import html
 
 
+# When both texts are longer than this, similarity is estimated in linear time
+# instead of running SequenceMatcher's quadratic matching; changed spans longer
+# than this in total are highlighted whole instead of character by character
+_MAX_DIFF_LEN = 200000
+
+# Diff granularities accepted by compare_texts
+_GRANULARITIES = ('line', 'char')
+
+
+def _common_affixes(text1: str, text2: str) -> Tuple[int, int]:
+    """
+    Find the lengths of the common prefix and suffix of two texts.
+    
+    The prefix and suffix never overlap. Both searches bisect using slice
+    comparisons, which run in C, instead of stepping one character at a time.
+    
+    Returns:
+        Tuple of (prefix_length, suffix_length)
+    """
+    # Longest matching prefix: everything below lo is known to match
+    lo, hi = 0, min(len(text1), len(text2))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if text1[lo:mid] == text2[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+    
+    # Longest matching suffix within what the prefix left over
+    end1, end2 = len(text1), len(text2)
+    lo, hi = 0, min(end1, end2) - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if text1[end1 - mid:end1 - lo] == text2[end2 - mid:end2 - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    
+    return prefix, lo
+
+
+def _line_affixes(text1: str, text2: str, prefix: int, suffix: int) -> Tuple[int, int]:
+    """
+    Shrink common prefix/suffix lengths so they cover whole lines only.
+    
+    A line diff of the text between them then sees complete lines instead of
+    lines cut at the first and last differing character.
+    """
+    prefix = text1.rfind('\n', 0, prefix) + 1
+    start1, start2 = len(text1) - suffix, len(text2) - suffix
+    if suffix and not ((start1 == 0 or text1[start1 - 1] == '\n') and
+                       (start2 == 0 or text2[start2 - 1] == '\n')):
+        newline = text1.find('\n', start1)
+        suffix = len(text1) - newline - 1 if newline >= 0 else 0
+    return prefix, suffix
+
+
+class _FastSequenceMatcher(difflib.SequenceMatcher):
+    """
+    SequenceMatcher with a cheaper inner loop in find_longest_match.
+    
+    The stock loop walks every b-index of each a-element and range-checks
+    it against [blo, bhi) on every pass. Here the in-range slice of each
+    element's index list is cut once per call with bisect and reused for
+    repeated elements, so the inner loop does no bounds checks. Results
+    are identical to difflib's.
+    """
+    
+    def find_longest_match(self, alo=0, ahi=None, blo=0, bhi=None):
+        a, b, b2j, isbjunk = self.a, self.b, self.b2j, self.bjunk.__contains__
+        if ahi is None:
+            ahi = len(a)
+        if bhi is None:
+            bhi = len(b)
+        besti, bestj, bestsize = alo, blo, 0
+        
+        # b2j index lists are ascending, so the in-range part is one slice
+        trimmed = {}
+        nothing = ()
+        j2len = {}
+        for i in range(alo, ahi):
+            elt = a[i]
+            indices = trimmed.get(elt)
+            if indices is None:
+                indices = b2j.get(elt, nothing)
+                if indices:
+                    indices = indices[bisect_left(indices, blo):bisect_left(indices, bhi)]
+                trimmed[elt] = indices
+            
+            j2lenget = j2len.get
+            newj2len = {}
+            for j in indices:
+                k = newj2len[j] = j2lenget(j - 1, 0) + 1
+                if k > bestsize:
+                    besti, bestj, bestsize = i - k + 1, j - k + 1, k
+            j2len = newj2len
+        
+        # Extend the match with equal non-junk, then junk, elements on both
+        # sides (unchanged from difflib)
+        while besti > alo and bestj > blo and \
+              not isbjunk(b[bestj - 1]) and \
+              a[besti - 1] == b[bestj - 1]:
+            besti, bestj, bestsize = besti - 1, bestj - 1, bestsize + 1
+        while besti + bestsize < ahi and bestj + bestsize < bhi and \
+              not isbjunk(b[bestj + bestsize]) and \
+              a[besti + bestsize] == b[bestj + bestsize]:
+            bestsize += 1
+        
+        while besti > alo and bestj > blo and \
+              isbjunk(b[bestj - 1]) and \
+              a[besti - 1] == b[bestj - 1]:
+            besti, bestj, bestsize = besti - 1, bestj - 1, bestsize + 1
+        while besti + bestsize < ahi and bestj + bestsize < bhi and \
+              isbjunk(b[bestj + bestsize]) and \
+              a[besti + bestsize] == b[bestj + bestsize]:
+            bestsize += 1
+        
+        return difflib.Match(besti, bestj, bestsize)
+
+
 class TextComparator:
     """Text comparison utility with highlighting and similarity calculation."""
     
-    def __init__(self):
-        """Initialize the text comparator."""
-        pass
+    def __init__(self, autojunk: bool = True):
+        """
+        Initialize the text comparator.
+        
+        Args:
+            autojunk: Passed to difflib.SequenceMatcher; ignores very frequent
+                characters in long texts, trading precision for speed
+        """
+        self.autojunk = autojunk
     
-    def compare_texts(self, text1: str, text2: str) -> Dict[str, Any]:
+    def compare_texts(self, text1: str, text2: str, granularity: str = 'line',
+                      cutoff: float = 0.0) -> Dict[str, Any]:
         """
         Compare two texts and return detailed comparison results.
         
         Args:
             text1: First text to compare
             text2: Second text to compare
+            granularity: 'line' diffs whole lines and refines changed lines
+                character by character; 'char' diffs every character
+            cutoff: Similarity ratio (0.0-1.0) below which an exact figure is
+                not needed; such texts report a cheap upper-bound estimate
             
         Returns:
             Dictionary containing:
             - highlighted_text1: HTML with highlighted differences in text1
             - highlighted_text2: HTML with highlighted differences in text2
             - similarity_percentage: Similarity as percentage (0-100)
+            - similarity_is_estimate: True when similarity_percentage is an
+              upper-bound estimate rather than the exact figure
             - word_count_text1: Word count of text1
             - word_count_text2: Word count of text2
             - char_count_text1: Character count of text1
             - char_count_text2: Character count of text2
         """
         
+        if granularity not in _GRANULARITIES:
+            raise ValueError(f"granularity must be one of {', '.join(_GRANULARITIES)}, got {granularity!r}")
+        if not 0.0 <= cutoff <= 1.0:
+            raise ValueError(f"cutoff must be between 0 and 1, got {cutoff!r}")
+        
+        # Identical texts need no diffing at all
+        if text1 == text2:
+            escaped = html.escape(text1)
+            return {
+                'highlighted_text1': escaped,
+                'highlighted_text2': escaped,
+                'similarity_percentage': 100.0,
+                'similarity_is_estimate': False,
+                **self._calculate_statistics(text1, text2)
+            }
+        
+        # One matcher over the texts between their shared prefix and suffix,
+        # passed to both steps so the matching runs once per comparison. It
+        # lives only in this call, so concurrent comparisons never share one.
+        prefix, suffix = _common_affixes(text1, text2)
+        matcher = self._matcher(text1[prefix:len(text1) - suffix],
+                                text2[prefix:len(text2) - suffix])
+        
         # Calculate similarity percentage
-        similarity = self._calculate_similarity(text1, text2)
+        similarity, is_estimate = self._calculate_similarity(text1, text2, cutoff, matcher)
         
         # Generate highlighted HTML
-        highlighted_text1, highlighted_text2 = self._generate_highlighted_html(text1, text2)
+        highlighted_text1, highlighted_text2 = self._generate_highlighted_html(
+            text1, text2, granularity, matcher)
         
         # Calculate statistics
         stats = self._calculate_statistics(text1, text2)
@@ -56,97 +215,206 @@ class TextComparator:
             'highlighted_text1': highlighted_text1,
             'highlighted_text2': highlighted_text2,
             'similarity_percentage': round(similarity * 100, 2),
+            'similarity_is_estimate': is_estimate,
             **stats
         }
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
+    def _matcher(self, a, b) -> difflib.SequenceMatcher:
+        """Build a SequenceMatcher over two sequences with this comparator's autojunk."""
+        return _FastSequenceMatcher(None, a, b, autojunk=self.autojunk)
+    
+    def _calculate_similarity(self, text1: str, text2: str, cutoff: float = 0.0,
+                              matcher: difflib.SequenceMatcher = None) -> Tuple[float, bool]:
         """
         Calculate similarity ratio between two texts using SequenceMatcher.
         
         Args:
             text1: First text
             text2: Second text
+            cutoff: Return an upper-bound estimate instead of the exact ratio
+                when that estimate is already below this value
+            matcher: Matcher over the texts without their common prefix and
+                suffix (built here if not given)
             
         Returns:
-            Similarity ratio (0.0 to 1.0)
+            Tuple of (similarity ratio from 0.0 to 1.0, whether it is an
+            upper-bound estimate rather than the exact ratio)
         """
-        matcher = difflib.SequenceMatcher(None, text1, text2)
-        return matcher.ratio()
+        if text1 == text2:
+            return 1.0, False
+        
+        # Only the part between the shared prefix and suffix needs matching;
+        # the shared characters count as matches on both sides
+        prefix, suffix = _common_affixes(text1, text2)
+        middle1 = text1[prefix:len(text1) - suffix]
+        middle2 = text2[prefix:len(text2) - suffix]
+        
+        shared = 2 * (prefix + suffix)
+        middle_len = len(middle1) + len(middle2)
+        total_len = len(text1) + len(text2)
+        
+        if matcher is None:
+            matcher = self._matcher(middle1, middle2)
+        if cutoff > 0:
+            # Cheap upper bounds first (from lengths, then character counts);
+            # once one falls below the cutoff the exact ratio isn't needed
+            for estimate in (matcher.real_quick_ratio, matcher.quick_ratio):
+                bound = (shared + estimate() * middle_len) / total_len
+                if bound < cutoff:
+                    return bound, True
+        
+        if min(len(middle1), len(middle2)) > _MAX_DIFF_LEN:
+            # Upper bound from shared character counts; ratio() would be quadratic
+            return (shared + matcher.quick_ratio() * middle_len) / total_len, True
+        
+        return (shared + matcher.ratio() * middle_len) / total_len, False
     
-    def _generate_highlighted_html(self, text1: str, text2: str) -> Tuple[str, str]:
+    def _generate_highlighted_html(self, text1: str, text2: str, granularity: str = 'line',
+                                   matcher: difflib.SequenceMatcher = None) -> Tuple[str, str]:
         """
         Generate HTML with highlighted differences for both texts.
         
         Args:
             text1: First text
             text2: Second text
+            granularity: 'line' or 'char' (see compare_texts)
+            matcher: Optional character matcher (see _calculate_similarity)
             
         Returns:
             Tuple of (highlighted_text1, highlighted_text2)
         """
         
-        # Split texts into lines for better comparison
-        lines1 = text1.splitlines(keepends=True)
-        lines2 = text2.splitlines(keepends=True)
-        
-        # Create diff
-        differ = difflib.unified_diff(lines1, lines2, n=0)
-        diff_list = list(differ)
-        
         # If no differences, return escaped original texts
-        if len(diff_list) <= 2:  # Only headers
+        if text1 == text2:
             return html.escape(text1), html.escape(text2)
         
-        # Use HtmlDiff for better formatting
-        html_differ = difflib.HtmlDiff(wrapcolumn=80)
-        diff_table = html_differ.make_table(lines1, lines2, 
-                                          context=True, 
-                                          numlines=3)
-        
-        # Extract the two columns from the diff table
-        highlighted1, highlighted2 = self._extract_highlighted_texts(text1, text2)
-        
-        return highlighted1, highlighted2
+        return self._extract_highlighted_texts(text1, text2, granularity, matcher)
     
-    def _extract_highlighted_texts(self, text1: str, text2: str) -> Tuple[str, str]:
+    def _extract_highlighted_texts(self, text1: str, text2: str, granularity: str = 'line',
+                                   matcher: difflib.SequenceMatcher = None) -> Tuple[str, str]:
         """
-        Extract highlighted texts by comparing character by character.
+        Extract highlighted texts by comparing line by line or character by character.
         
         Args:
             text1: First text
             text2: Second text
+            granularity: 'line' or 'char' (see compare_texts)
+            matcher: Optional character matcher (see _calculate_similarity),
+                reused by the 'char' granularity
             
         Returns:
             Tuple of highlighted HTML strings
         """
         
-        # Use SequenceMatcher for detailed comparison
-        matcher = difflib.SequenceMatcher(None, text1, text2)
+        if text1 == text2:
+            return html.escape(text1), html.escape(text2)
+        
+        # Diff only the part between the shared prefix and suffix
+        prefix, suffix = _common_affixes(text1, text2)
+        if granularity != 'char':
+            prefix, suffix = _line_affixes(text1, text2, prefix, suffix)
+        end1 = len(text1) - suffix
+        end2 = len(text2) - suffix
+        middle1 = text1[prefix:end1]
+        middle2 = text2[prefix:end2]
         
         highlighted1 = []
         highlighted2 = []
         
-        # Process each matching block
+        if prefix:
+            escaped = html.escape(text1[:prefix])
+            highlighted1.append(escaped)
+            highlighted2.append(escaped)
+        
+        if granularity == 'char':
+            self._highlight_chars(middle1, middle2, highlighted1, highlighted2, matcher)
+        else:
+            self._highlight_lines(middle1, middle2, highlighted1, highlighted2)
+        
+        if suffix:
+            escaped = html.escape(text1[end1:])
+            highlighted1.append(escaped)
+            highlighted2.append(escaped)
+        
+        return ''.join(highlighted1), ''.join(highlighted2)
+    
+    def _highlight_lines(self, text1: str, text2: str,
+                         highlighted1: List[str], highlighted2: List[str]) -> None:
+        """
+        Append highlighted HTML for a line-level diff of two texts.
+        
+        Whole lines are matched first, so the matcher works on a few items per
+        line instead of every character; only replaced lines are then diffed
+        character by character.
+        """
+        lines1 = text1.splitlines(keepends=True)
+        lines2 = text2.splitlines(keepends=True)
+        matcher = self._matcher(lines1, lines2)
+        
+        escape = html.escape
+        append1 = highlighted1.append
+        append2 = highlighted2.append
+        
         for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            text1_segment = text1[i1:i2]
-            text2_segment = text2[j1:j2]
+            if tag == 'equal':
+                # Equal segments are the same text, so escape it once
+                escaped = escape(''.join(lines1[i1:i2]))
+                append1(escaped)
+                append2(escaped)
+                continue
             
+            text1_segment = ''.join(lines1[i1:i2])
+            text2_segment = ''.join(lines2[j1:j2])
+            if tag == 'delete':
+                append1(f'<span class="text-deleted">{escape(text1_segment)}</span>')
+            elif tag == 'insert':
+                append2(f'<span class="text-inserted">{escape(text2_segment)}</span>')
+            else:
+                # Refine replaced lines character by character
+                self._highlight_chars(text1_segment, text2_segment, highlighted1, highlighted2)
+    
+    def _highlight_chars(self, text1: str, text2: str,
+                         highlighted1: List[str], highlighted2: List[str],
+                         matcher: difflib.SequenceMatcher = None) -> None:
+        """
+        Append highlighted HTML for a character-level diff of two texts.
+        
+        matcher, when given, must be a SequenceMatcher over text1 and text2.
+        Texts longer than _MAX_DIFF_LEN together are marked as modified
+        whole, since matching them would be quadratic.
+        """
+        
+        if text1 and text2 and len(text1) + len(text2) > _MAX_DIFF_LEN:
+            highlighted1.append(f'<span class="text-modified">{html.escape(text1)}</span>')
+            highlighted2.append(f'<span class="text-modified">{html.escape(text2)}</span>')
+            return
+        
+        # Use SequenceMatcher for detailed comparison
+        if matcher is None:
+            matcher = self._matcher(text1, text2)
+        
+        escape = html.escape
+        append1 = highlighted1.append
+        append2 = highlighted2.append
+        
+        # Process each matching block; equal and replace blocks alternate for
+        # most edits, so they are tested first
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
             if tag == 'equal':
-                # Identical segments
-                highlighted1.append(html.escape(text1_segment))
-                highlighted2.append(html.escape(text2_segment))
+                # Identical segments (escaped once, shared by both sides)
+                escaped = escape(text1[i1:i2])
+                append1(escaped)
+                append2(escaped)
+            elif tag == 'replace':
+                # Modified segments
+                append1(f'<span class="text-modified">{escape(text1[i1:i2])}</span>')
+                append2(f'<span class="text-modified">{escape(text2[j1:j2])}</span>')
             elif tag == 'delete':
                 # Deleted from text1
-                highlighted1.append(f'<span class="text-deleted">{html.escape(text1_segment)}</span>')
-            elif tag == 'insert':
+                append1(f'<span class="text-deleted">{escape(text1[i1:i2])}</span>')
+            else:
                 # Inserted in text2
-                highlighted2.append(f'<span class="text-inserted">{html.escape(text2_segment)}</span>')
-            elif tag == 'replace':
-                # Modified segments
-                highlighted1.append(f'<span class="text-modified">{html.escape(text1_segment)}</span>')
-                highlighted2.append(f'<span class="text-modified">{html.escape(text2_segment)}</span>')
-        
-        return ''.join(highlighted1), ''.join(highlighted2)
+                append2(f'<span class="text-inserted">{escape(text2[j1:j2])}</span>')
     
     def _calculate_statistics(self, text1: str, text2: str) -> Dict[str, int]:
         """
@@ -198,15 +466,18 @@ class TextComparator:
 text_comparator = TextComparator()
 
 
-def compare_texts(text1: str, text2: str) -> Dict[str, Any]:
+def compare_texts(text1: str, text2: str, granularity: str = 'line',
+                  cutoff: float = 0.0) -> Dict[str, Any]:
     """
     Convenience function to compare two texts.
     
     Args:
         text1: First text to compare
         text2: Second text to compare
+        granularity: 'line' (default) or 'char' diff highlighting
+        cutoff: Similarity ratio (0.0-1.0) below which an estimate is enough
         
     Returns:
         Comparison results dictionary
     """
-    return text_comparator.compare_texts(text1, text2)
\ No newline at end of file
+    return text_comparator.compare_texts(text1, text2, granularity, cutoff)
\ No newline at end of file
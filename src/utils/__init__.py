@@ -5,6 +5,7 @@ Utilities Package
 Common utility functions and classes used throughout the project.
 
 Modules:
+- cleaning.py: Shared hex/Base64 input cleanup
 - exceptions.py: Custom exception classes
 - file_handler.py: File I/O utilities
 - format_detection.py: Automatic format detection
@@ -0,0 +1,25 @@
+"""
+Input Cleaning
+==============
+
+Shared cleanup for textual hex and Base64 input, so the converters and the
+CLI's streaming decoders accept exactly the same spellings.
+"""
+
+# Separators allowed between hex digits
+HEX_SEPARATORS = ': -\t\r\n'
+
+# Hex separators, and the ASCII whitespace dropped from Base64 input, each
+# removed in a single translate() pass
+_HEX_STRIP = str.maketrans('', '', HEX_SEPARATORS)
+_WHITESPACE_STRIP = str.maketrans('', '', ' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f')
+
+
+def clean_hex(text: str) -> str:
+    """Drop separators and whitespace, then any ``0x`` prefixes, from hex text."""
+    return text.translate(_HEX_STRIP).replace('0x', '')
+
+
+def strip_whitespace(text: str) -> str:
+    """Drop the ASCII whitespace Base64 decoders should ignore."""
+    return text.translate(_WHITESPACE_STRIP)
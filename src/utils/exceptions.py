@@ -11,6 +11,37 @@ Learning Concepts:
 - Exception Chaining: Preserving original error information
 """
 
+# Message templates indexed by which context fields are set:
+# bit 0 = first field present, bit 1 = second field present.
+_CONVERSION_MESSAGES = (
+    lambda m, f, t: m,
+    lambda m, f, t: f"Format '{f}': {m}",
+    lambda m, f, t: f"Format '{t}': {m}",
+    lambda m, f, t: f"Conversion from '{f}' to '{t}': {m}",
+)
+
+_VALIDATION_MESSAGES = (
+    lambda m, d, e: m,
+    lambda m, d, e: f"Validation failed for {d}: {m}",
+    lambda m, d, e: f"Validation failed (expected {e}): {m}",
+    lambda m, d, e: f"Validation failed for {d} (expected {e}): {m}",
+)
+
+_CONFIGURATION_MESSAGES = (
+    lambda m, k, f: m,
+    lambda m, k, f: f"Configuration error at key '{k}': {m}",
+    lambda m, k, f: f"Configuration error in '{f}': {m}",
+    lambda m, k, f: f"Configuration error in '{f}' at key '{k}': {m}",
+)
+
+_PROCESSING_MESSAGES = (
+    lambda m, s, p: m,
+    lambda m, s, p: f"Processing error in stage '{s}': {m}",
+    lambda m, s, p: f"Processing error for file '{p}': {m}",
+    lambda m, s, p: f"Processing error in stage '{s}' for file '{p}': {m}",
+)
+
+
 class ConversionError(Exception):
     """
     Base exception for all conversion-related errors.
@@ -25,6 +56,8 @@ class ConversionError(Exception):
         original_error (Exception): Original exception that caused this error
     """
     
+    __slots__ = ('message', 'from_format', 'to_format', 'original_error')
+    
     def __init__(self, message: str, from_format: str = None, to_format: str = None, original_error: Exception = None):
         """
         Initialize a ConversionError.
@@ -40,20 +73,9 @@ class ConversionError(Exception):
         self.to_format = to_format
         self.original_error = original_error
         
-        # Create a detailed error message
-        full_message = message
-        if from_format and to_format:
-            full_message = f"Conversion from '{from_format}' to '{to_format}': {message}"
-        elif from_format:
-            full_message = f"Format '{from_format}': {message}"
-        elif to_format:
-            full_message = f"Format '{to_format}': {message}"
-            
-        super().__init__(full_message)
-    
-    def __str__(self):
-        """Return a string representation of the error."""
-        return self.args[0] if self.args else self.message
+        # Create a detailed error message (str() returns it via args[0])
+        template = _CONVERSION_MESSAGES[bool(from_format) | bool(to_format) << 1]
+        super().__init__(template(message, from_format, to_format))
 
 
 class UnsupportedFormatError(ConversionError):
@@ -65,6 +87,8 @@ class UnsupportedFormatError(ConversionError):
     - A conversion pair is not available (e.g., trying to convert PDF to MP3)
     """
     
+    __slots__ = ('available_formats',)
+    
     def __init__(self, from_format: str, to_format: str, available_formats: list = None):
         """
         Initialize an UnsupportedFormatError.
@@ -92,6 +116,8 @@ class ValidationError(ConversionError):
     - Required parameters are missing
     """
     
+    __slots__ = ('data_type', 'expected_format')
+    
     def __init__(self, message: str, data_type: str = None, expected_format: str = None):
         """
         Initialize a ValidationError.
@@ -101,15 +127,8 @@ class ValidationError(ConversionError):
             data_type: Type of data that failed validation (optional)
             expected_format: Expected format of the data (optional)
         """
-        full_message = message
-        if data_type and expected_format:
-            full_message = f"Validation failed for {data_type} (expected {expected_format}): {message}"
-        elif data_type:
-            full_message = f"Validation failed for {data_type}: {message}"
-        elif expected_format:
-            full_message = f"Validation failed (expected {expected_format}): {message}"
-            
-        super().__init__(full_message)
+        template = _VALIDATION_MESSAGES[bool(data_type) | bool(expected_format) << 1]
+        super().__init__(template(message, data_type, expected_format))
         self.data_type = data_type
         self.expected_format = expected_format
 
@@ -124,6 +143,8 @@ class ConfigurationError(ConversionError):
     - Configuration values are out of range
     """
     
+    __slots__ = ('config_key', 'config_file')
+    
     def __init__(self, message: str, config_key: str = None, config_file: str = None):
         """
         Initialize a ConfigurationError.
@@ -133,15 +154,8 @@ class ConfigurationError(ConversionError):
             config_key: The configuration key that caused the error (optional)
             config_file: The configuration file with the error (optional)
         """
-        full_message = message
-        if config_key and config_file:
-            full_message = f"Configuration error in '{config_file}' at key '{config_key}': {message}"
-        elif config_key:
-            full_message = f"Configuration error at key '{config_key}': {message}"
-        elif config_file:
-            full_message = f"Configuration error in '{config_file}': {message}"
-            
-        super().__init__(full_message)
+        template = _CONFIGURATION_MESSAGES[bool(config_key) | bool(config_file) << 1]
+        super().__init__(template(message, config_key, config_file))
         self.config_key = config_key
         self.config_file = config_file
 
@@ -156,6 +170,8 @@ class ProcessingError(ConversionError):
     - Memory or resource constraints are hit
     """
     
+    __slots__ = ('stage', 'file_path')
+    
     def __init__(self, message: str, stage: str = None, file_path: str = None):
         """
         Initialize a ProcessingError.
@@ -165,46 +181,43 @@ class ProcessingError(ConversionError):
             stage: The processing stage where the error occurred (optional)
             file_path: The file being processed when the error occurred (optional)
         """
-        full_message = message
-        if stage and file_path:
-            full_message = f"Processing error in stage '{stage}' for file '{file_path}': {message}"
-        elif stage:
-            full_message = f"Processing error in stage '{stage}': {message}"
-        elif file_path:
-            full_message = f"Processing error for file '{file_path}': {message}"
-            
-        super().__init__(full_message)
+        template = _PROCESSING_MESSAGES[bool(stage) | bool(file_path) << 1]
+        super().__init__(template(message, stage, file_path))
         self.stage = stage
         self.file_path = file_path
 
 
-# Convenience function for error handling
-def handle_conversion_error(func):
+# Built-in exceptions translated by translate_error: {type: (error_class, prefix)}
+_ERROR_TRANSLATIONS = {
+    ValueError: (ValidationError, "Invalid data"),
+    FileNotFoundError: (ProcessingError, "File not found"),
+    MemoryError: (ProcessingError, "Insufficient memory"),
+}
+_DEFAULT_TRANSLATION = (ConversionError, "Unexpected error")
+
+
+def translate_error(error: Exception) -> ConversionError:
     """
-    Decorator to handle and re-raise conversion errors with context.
+    Wrap a built-in exception in the matching ConversionError subclass.
     
-    This decorator catches common exceptions and converts them to our custom
-    ConversionError types with additional context information.
+    The original exception is kept in original_error; callers should also
+    chain it with ``raise translate_error(e) from e``.
     
-    Usage:
-        @handle_conversion_error
-        def my_conversion_function():
-            # conversion logic here
-            pass
+    Args:
+        error: The exception to translate
+        
+    Returns:
+        A ConversionError (or subclass) describing the error
     """
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except ConversionError:
-            # Re-raise our custom errors as-is
-            raise
-        except ValueError as e:
-            raise ValidationError(f"Invalid data: {str(e)}", original_error=e)
-        except FileNotFoundError as e:
-            raise ProcessingError(f"File not found: {str(e)}", original_error=e)
-        except MemoryError as e:
-            raise ProcessingError(f"Insufficient memory: {str(e)}", original_error=e)
-        except Exception as e:
-            raise ConversionError(f"Unexpected error: {str(e)}", original_error=e)
-    
-    return wrapper
\ No newline at end of file
+    # Walk the MRO so subclasses (e.g. UnicodeDecodeError) match their base entry
+    for exc_type in type(error).__mro__:
+        translation = _ERROR_TRANSLATIONS.get(exc_type)
+        if translation is not None:
+            break
+    else:
+        translation = _DEFAULT_TRANSLATION
+    
+    error_class, prefix = translation
+    wrapped = error_class(f"{prefix}: {error}")
+    wrapped.original_error = error
+    return wrapped
@@ -9,4 +9,9 @@ Provides:
 - Real-time conversion progress
 - Interactive format selection
 - Batch processing UI
-"""
\ No newline at end of file
+"""
+
+from PIL import Image as _Image
+
+# Scan Pillow's format plugins now rather than on the first image request
+_Image.init()
@@ -130,8 +130,17 @@ def compare_texts_api():
                 'error': 'Both text fields are required'
             }), 400
         
-        # Compare the texts
-        result = compare_texts(text1, text2)
+        # Optional diff settings: highlight granularity and the similarity
+        # below which an estimate is enough (see compare_texts)
+        try:
+            result = compare_texts(text1, text2,
+                                   granularity=data.get('granularity', 'line'),
+                                   cutoff=float(data.get('cutoff', 0.0)))
+        except (TypeError, ValueError) as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         
         return jsonify({
             'success': True,
@@ -532,7 +541,9 @@ def merge_pdf():
             'error': f'Server error: {str(e)}'
         }), 500
 
-if __name__ == '__main__':
+
+def main():
+    """Run the development server (use converter-web-prod for deployments)."""
     # Import converters to register them
     from src.converters import simple_converters
     
@@ -549,4 +560,8 @@ if __name__ == '__main__':
         print(f"   Error loading conversions: {e}")
     
     print("\n🚀 Web interface available at: http://127.0.0.1:5000")
-    app.run(debug=True, host='127.0.0.1', port=5000)
\ No newline at end of file
+    app.run(debug=True, host='127.0.0.1', port=5000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""
+Production Server for the Web Interface
+=======================================
+
+Serves the Flask app through waitress, a multi-threaded WSGI server,
+instead of Flask's development server.
+
+    converter-web         # Flask dev server (debug, auto-reload)
+    converter-web-prod    # waitress, for deployments
+
+Learning Concepts:
+- WSGI: the interface between Python web apps and web servers
+- Dev vs prod: the Flask dev server is not built for concurrent traffic
+"""
+
+from .app import app
+
+
+def serve(host: str = '0.0.0.0', port: int = 5000, threads: int = 16):
+    """
+    Serve the web interface with waitress.
+    
+    Args:
+        host: Interface to bind to
+        port: Port to listen on
+        threads: Number of worker threads handling requests
+    """
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        raise SystemExit("waitress is required for converter-web-prod: pip install waitress")
+    
+    print(f"🚀 Serving Universal File Operator on http://{host}:{port} ({threads} threads)")
+    waitress_serve(app, host=host, port=port, threads=threads)
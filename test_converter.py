@@ -98,11 +98,98 @@ def test_cli():
         print(f"❌ CLI test failed: {e}")
         return False
 
+def test_number_batches():
+    """Test batch input for the decimal/binary/hex number converters."""
+    print("\n🔢 Testing Number Batch Conversions")
+    print("=" * 30)
+    
+    from src.converters.simple_converters import (
+        BinaryToDecimalConverter, DecimalToBinaryConverter, DecimalToHexConverter
+    )
+    from src.utils.exceptions import ConversionError
+    
+    to_binary = DecimalToBinaryConverter()
+    to_decimal = BinaryToDecimalConverter()
+    to_hex = DecimalToHexConverter()
+    
+    # Lists and tuples give the same results as one convert() per value
+    numbers = [0, 5, -5, '255', -4096]
+    for batch in (numbers, tuple(numbers)):
+        assert to_binary.convert(batch) == ['0', '101', '101', '11111111', '1000000000000']
+        assert to_binary.convert(batch, include_prefix=True) == [
+            to_binary.convert(n, include_prefix=True) for n in numbers]
+        assert to_hex.convert(batch) == ['0', '5', '-5', 'ff', '-1000']
+        for options in ({'include_prefix': True}, {'uppercase': True},
+                        {'include_prefix': True, 'uppercase': True}):
+            assert to_hex.convert(batch, **options) == [to_hex.convert(n, **options) for n in numbers]
+    assert to_hex.convert([255, -255], include_prefix=True, uppercase=True) == ['0xFF', '-0xFF']
+    
+    binaries = ['101', ' 0b11 ', '0']
+    assert to_decimal.convert(binaries) == [5, 3, 0]
+    assert to_decimal.convert(tuple(binaries)) == [5, 3, 0]
+    
+    # An invalid item fails the same way as converting it on its own
+    for bad in ('12', ''):
+        errors = []
+        for data in (bad, ['1', bad]):
+            try:
+                to_decimal.convert(data)
+            except ConversionError as e:
+                errors.append((type(e), str(e)))
+        assert len(errors) == 2 and errors[0] == errors[1], errors
+        assert errors[0][1].startswith('Failed to convert binary:')
+    
+    print("✅ Batch conversions match single-value conversions")
+    return True
+
+def test_stream_decode():
+    """Test that convert-file's streamed decoding matches convert()."""
+    print("\n📦 Testing Streamed File Decoding")
+    print("=" * 30)
+
+    import tempfile
+    from click.testing import CliRunner
+    from src.cli import main as cli_main
+    # Register the converters the CLI uses outside the streaming path
+    from src.converters import simple_converters
+    from src.converters.registry import convert
+
+    samples = {
+        'hex': '0xde:ad be-ef\n0x12\t0:x1f 0\r\nx20 0x41\n',
+        'base64': 'SGVs bG8s\nIFdv\tcmxk\r\nIQ==\n',
+    }
+
+    # A tiny chunk size puts chunk boundaries inside '0x' prefixes and blocks
+    saved_chunk = cli_main._STREAM_CHUNK
+    cli_main._STREAM_CHUNK = 3
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for from_format, text in samples.items():
+                input_path = os.path.join(tmp, f'input.{from_format}')
+                output_path = os.path.join(tmp, 'output.bin')
+                with open(input_path, 'w', encoding='utf-8', newline='') as f:
+                    f.write(text)
+
+                result = CliRunner().invoke(cli_main.cli, [
+                    'convert-file', input_path, '--from', from_format,
+                    '--to', 'binary', '-o', output_path,
+                ])
+                assert result.exit_code == 0, result.output
+                with open(output_path, 'rb') as f:
+                    assert f.read() == convert(text, from_format, 'binary'), from_format
+    finally:
+        cli_main._STREAM_CHUNK = saved_chunk
+
+    print("✅ Streamed decoding matches convert()")
+    return True
+
 if __name__ == "__main__":
     success = True
     
     success &= test_basic_conversions()
     success &= test_cli()
+    success &= test_number_batches()
+    success &= test_stream_decode()
     
     if success:
         print("\n🏆 All systems working correctly!")
@@ -6,11 +6,33 @@ Test Image Converters
 Quick test to verify image conversion capabilities.
 """
 
+import base64
+import io
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from PIL import Image
+
 from src.cli.main import convert, list_conversions
+from src.converters.registry import get_global_registry
+from src.utils.exceptions import ConversionError, ValidationError
+
+
+def _gradient(size):
+    """Build an RGBA test image whose pixels all differ."""
+    width, height = size
+    image = Image.new('RGBA', size)
+    image.putdata([((x * 7) % 256, (y * 5) % 256, (x * y) % 256, 255)
+                   for y in range(height) for x in range(width)])
+    return image
+
+
+def _png_bytes(size):
+    """Encode a gradient test image as PNG bytes."""
+    buffer = io.BytesIO()
+    _gradient(size).save(buffer, format='PNG')
+    return buffer.getvalue()
 
 
 def test_image_converters():
@@ -57,5 +79,111 @@ def test_image_converters():
     print("   python -m src.cli.main convert <image_path> --from image --to base64")
 
 
+
+def test_png_to_ico_sizes():
+    """PNG -> ICO through the registry writes the full icon size set."""
+    converter = get_global_registry().get_converter('png', 'ico')
+    icon = Image.open(io.BytesIO(converter.convert(_png_bytes((300, 300)))))
+    
+    expected = {(s, s) for s in (16, 24, 32, 48, 64, 128, 256)}
+    print(f"   ICO sizes: {sorted(icon.ico.sizes())}")
+    assert icon.ico.sizes() == expected
+    
+    # Halved sizes are box-reduced from the single LANCZOS resample
+    level = _gradient((300, 300))
+    level.thumbnail((256, 256), Image.Resampling.LANCZOS)
+    icon.size = (128, 128)
+    assert icon.convert('RGBA').tobytes() == level.reduce(2).tobytes()
+    
+    # Palette sources go through the same pyramid
+    gif = io.BytesIO()
+    Image.new('P', (64, 64)).save(gif, format='GIF')
+    icon = Image.open(io.BytesIO(convert(gif.getvalue(), 'gif', 'ico')))
+    assert icon.ico.sizes() == {(s, s) for s in (16, 24, 32, 48, 64)}
+
+
+
+def test_convert_chain():
+    """convert_chain applies intermediate modes and validates every format."""
+    converter = get_global_registry().get_converter('png', 'webp')
+    
+    # The JPEG hop flattens transparency before the final PNG encode
+    buffer = io.BytesIO()
+    Image.new('RGBA', (8, 8), (0, 0, 255, 0)).save(buffer, format='PNG')
+    result = converter.convert_chain(buffer.getvalue(), ['jpeg', 'png'])
+    image = Image.open(io.BytesIO(base64.b64decode(result)))
+    assert image.format == 'PNG'
+    assert image.getpixel((0, 0)) == (255, 255, 255, 255)
+    
+    # Unknown intermediate and final formats are both rejected up front
+    for chain in (['nope', 'png'], ['png', 'nope']):
+        try:
+            converter.convert_chain(buffer.getvalue(), chain)
+        except ValidationError as e:
+            assert 'nope' in str(e)
+        else:
+            raise AssertionError(f"{chain} was accepted")
+
+
+
+def test_convert_batch():
+    """convert_batch keeps input order and raises the first item's error."""
+    converter = get_global_registry().get_converter('png', 'bmp')
+    sizes = [(40, 10), (3, 3), (25, 60), (1, 1), (64, 64)]
+    
+    results = converter.convert_batch([_png_bytes(size) for size in sizes])
+    assert [Image.open(io.BytesIO(result)).size for result in results] == sizes
+    
+    # Two different failures: the earlier one in input order wins
+    good = _png_bytes((8, 8))
+    try:
+        converter.convert_batch([good, good[:60], good, b'not an image'])
+    except ConversionError as e:
+        assert 'truncated' in str(e)
+    else:
+        raise AssertionError("failing item was not reported")
+
+
+def test_conversion_table_settings():
+    """The registry's image -> image converters apply the conversion table's settings."""
+    registry = get_global_registry()
+    png = _png_bytes((40, 30))
+    
+    tiff = Image.open(io.BytesIO(registry.get_converter('png', 'tiff').convert(png)))
+    assert tiff.info['compression'] == 'tiff_lzw'
+    
+    jpeg = registry.get_converter('png', 'jpeg').convert(png)
+    as_png = Image.open(io.BytesIO(registry.get_converter('jpeg', 'png').convert(jpeg)))
+    assert as_png.mode == 'RGBA'
+    
+    # Every source format gets the full ICO size pyramid, not just PNG
+    icon = Image.open(io.BytesIO(registry.get_converter('jpeg', 'ico').convert(
+        registry.get_converter('png', 'jpeg').convert(_png_bytes((300, 300))))))
+    assert icon.ico.sizes() == {(s, s) for s in (16, 24, 32, 48, 64, 128, 256)}
+
+
+def test_one_encoder_per_pair():
+    """Every image -> image pair the registry returns has its own _fast_encode."""
+    from src.converters.image_converters import IMAGE_FORMATS
+    
+    registry = get_global_registry()
+    encoders = set()
+    for src in IMAGE_FORMATS:
+        for dst in IMAGE_FORMATS:
+            if src == dst:
+                continue
+            cls = type(registry.get_converter(src, dst))
+            assert cls.__name__ == f"{src.capitalize()}To{dst.capitalize()}Converter"
+            encode = cls.__dict__['_fast_encode'].__func__
+            assert encode.__qualname__ == '_make_encoder.<locals>.encode'
+            encoders.add(encode)
+    assert len(encoders) == len(IMAGE_FORMATS) * (len(IMAGE_FORMATS) - 1)
+
+
 if __name__ == "__main__":
-    test_image_converters()
\ No newline at end of file
+    test_image_converters()
+    test_png_to_ico_sizes()
+    test_convert_chain()
+    test_convert_batch()
+    test_conversion_table_settings()
+    test_one_encoder_per_pair()
\ No newline at end of file
@@ -6,6 +6,8 @@ This script tests both the backend text comparison logic and the file handling c
 
 import sys
 import os
+import re
+import html
 import tempfile
 import json
 
@@ -161,6 +163,53 @@ def test_statistics():
     return stats_correct
 
 
+def _strip_highlighting(highlighted):
+    """Turn highlighted HTML back into the plain text it was built from."""
+    return html.unescape(re.sub(r'<span class="text-\w+">|</span>', '', highlighted))
+
+
+def test_granularity():
+    """Test line- and character-level highlighting."""
+    print("🔍 Testing Diff Granularity")
+    print("-" * 40)
+    
+    text1 = "a < b & c\nsecond line\nthird line\n"
+    text2 = "a > b & c\nsecond line!\nthird line\nfourth line\n"
+    
+    # Both granularities highlight without losing or altering any text
+    for granularity in ('line', 'char'):
+        result = compare_texts(text1, text2, granularity=granularity)
+        assert _strip_highlighting(result['highlighted_text1']) == text1
+        assert _strip_highlighting(result['highlighted_text2']) == text2
+        print(f"✅ {granularity}: highlighting round-trips to the input")
+    
+    # Character granularity keeps the original character-by-character output
+    result = compare_texts("The quick brown fox", "The slow brown dog", granularity='char')
+    assert result['highlighted_text1'] == (
+        'The <span class="text-modified">quick</span> brown '
+        '<span class="text-modified">f</span>o<span class="text-modified">x</span>')
+    assert result['highlighted_text2'] == (
+        'The <span class="text-modified">slow</span> brown '
+        '<span class="text-modified">d</span>o<span class="text-modified">g</span>')
+    
+    result = compare_texts("a < b & c\nsecond line\n", "a > b & c\nsecond line!\n", granularity='char')
+    assert result['highlighted_text1'] == 'a <span class="text-modified">&lt;</span> b &amp; c\nsecond line\n'
+    assert result['highlighted_text2'] == (
+        'a <span class="text-modified">&gt;</span> b &amp; c\n'
+        'second line<span class="text-inserted">!</span>\n')
+    
+    # Line granularity marks added lines as a whole
+    result = compare_texts(text1, text2)
+    assert result['highlighted_text2'].endswith('<span class="text-inserted">fourth line\n</span>')
+    
+    try:
+        compare_texts(text1, text2, granularity='word')
+    except ValueError:
+        print("✅ Invalid granularity rejected\n")
+    else:
+        raise AssertionError("granularity='word' was accepted")
+
+
 def run_all_tests():
     """Run all tests and provide summary."""
     print("🚀 Running Comprehensive Text Comparison Tests")
@@ -171,7 +220,8 @@ def run_all_tests():
         ("File Formats", test_file_formats),
         ("Edge Cases", test_edge_cases),
         ("HTML Highlighting", test_html_highlighting),
-        ("Statistics", test_statistics)
+        ("Statistics", test_statistics),
+        ("Granularity", test_granularity)
     ]
     
     results = []